@@ -1,32 +1,111 @@
 import json
 import os
 
-def read_json_file(file_path):
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = json.loads
+
+try:
+    import ijson
+
+    _STREAM_ERRORS = (ijson.JSONError,)
+except ImportError:  # ijson is optional; large files are then parsed in one shot
+    ijson = None
+    _STREAM_ERRORS = ()
+
+# Files larger than this are parsed incrementally with ijson when it is available
+_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Parsed contents keyed by path, tagged with the (mtime_ns, size) they were read at
+_cache = {}
+
+def _is_object(json_file):
+    """Whether the JSON document in a binary file starts with an object. The file is rewound."""
+    while True:
+        chunk = json_file.read(8192)
+        start = chunk.lstrip()
+        if start or not chunk:
+            break
+    json_file.seek(0)
+    return start[:1] == b'{'
+
+def read_json_file(file_path, mutable=False):
     """
     Reads the contents of a JSON file and returns it as a dictionary.
 
     Parameters:
     file_path (str): The path to the JSON file.
+    mutable (bool): Whether to return a freshly parsed result the caller may
+                    modify instead of the shared cached one. Defaults to False.
 
     Returns:
     dict or None: The contents of the JSON file as a dictionary if successful.
                   None if the file does not exist or the content is not valid JSON.
+
+    Parsed contents are cached per path and reused until the file's
+    modification time or size changes. The cached object itself is returned
+    and is shared by every caller, so it must be treated as read-only; with
+    mutable=True the file is parsed afresh and the cache is bypassed. Files above 8 MiB holding an object are
+    parsed incrementally with ijson when it is installed.
     """
-    if not os.path.exists(file_path):
+    try:
+        with open(file_path, 'rb') as json_file:
+            st = os.fstat(json_file.fileno())
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = None if mutable else _cache.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            if ijson is not None and st.st_size > _STREAM_THRESHOLD and _is_object(json_file):
+                data = dict(ijson.kvitems(json_file, '', use_float=True))
+            else:
+                data = _loads(json_file.read())
+        if not mutable:
+            _cache[file_path] = (stamp, data)
+        return data
+    except FileNotFoundError:
+        # Reported by open() itself rather than checked beforehand
         print(f"Error: The file '{file_path}' does not exist.")
         return None
-
-    try:
-        with open(file_path, 'r', encoding='utf-8') as json_file:
-            data = json.load(json_file)
-            return data
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError,) + _STREAM_ERRORS:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         print(f"Error: The file '{file_path}' contains invalid JSON.")
         return None
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
         return None
 
+def read_json_file_stream(file_path, item_prefix='item'):
+    """
+    Lazily yields the items found under a prefix of a JSON file.
+
+    Only one item is held in memory at a time, so callers iterate over
+    multi-megabyte files instead of loading them whole.
+
+    Parameters:
+    file_path (str): The path to the JSON file.
+    item_prefix (str): The ijson prefix of the items to yield (default 'item',
+                       the elements of a top-level array).
+
+    Yields:
+    Any: Each item found under item_prefix. Nothing more is yielded if the
+         file does not exist or the content is not valid JSON.
+
+    Raises:
+    ImportError: If ijson is not installed.
+    """
+    if ijson is None:
+        raise ImportError("read_json_file_stream requires ijson.")
+    try:
+        with open(file_path, 'rb') as json_file:
+            yield from ijson.items(json_file, item_prefix, use_float=True)
+    except FileNotFoundError:
+        print(f"Error: The file '{file_path}' does not exist.")
+    except ijson.JSONError:
+        print(f"Error: The file '{file_path}' contains invalid JSON.")
+
 # Example usage:
 if __name__ == "__main__":
     file_path = 'example.json'
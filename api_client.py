@@ -1,7 +1,34 @@
+import functools
+import json
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, Timeout, RequestException
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import logging
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = json.loads
+
+try:
+    import httpx
+
+    _HTTP_ERRORS = (HTTPError, httpx.HTTPStatusError)
+    _TIMEOUT_ERRORS = (Timeout, httpx.TimeoutException)
+    _REQUEST_ERRORS = (RequestException, httpx.RequestError)
+except ImportError:  # httpx is optional; only needed for HTTP/2 and the async methods
+    httpx = None
+    _HTTP_ERRORS = (HTTPError,)
+    _TIMEOUT_ERRORS = (Timeout,)
+    _REQUEST_ERRORS = (RequestException,)
+
+# Unsuccessful status codes and undecodable JSON bodies
+_RESPONSE_ERRORS = _HTTP_ERRORS + (ValueError,)
+
 logging.basicConfig(level=logging.INFO)
 
 
@@ -13,9 +40,11 @@ class APIClient:
         base_url (str): The base URL for the API.
         headers (dict): Default headers to include in every request.
         timeout (int): Timeout duration for requests in seconds.
+        session (requests.Session | httpx.Client): Pooled session shared by all requests.
+        use_http2 (bool): Whether requests go over HTTP/2 through httpx.
     """
 
-    def __init__(self, base_url, headers=None, timeout=10):
+    def __init__(self, base_url, headers=None, timeout=10, use_http2=False):
         """
         Initializes the APIClient with the given base URL, headers, and timeout.
 
@@ -23,10 +52,65 @@ class APIClient:
             base_url (str): The base URL for the API.
             headers (dict, optional): Default headers to include in every request. Defaults to None.
             timeout (int, optional): Timeout duration for requests in seconds. Defaults to 10.
+            use_http2 (bool, optional): Send requests through an ``httpx.Client`` with HTTP/2
+                multiplexing instead of ``requests``. Requires ``httpx[http2]``. Defaults to False.
+
+        Raises:
+            ImportError: If use_http2 is True and httpx is not installed.
         """
         self.base_url = base_url
         self.headers = headers if headers is not None else {}
         self.timeout = timeout
+        self.use_http2 = use_http2
+        self._async_session = None
+        if use_http2:
+            if httpx is None:
+                raise ImportError("use_http2 requires httpx (pip install 'httpx[http2]').")
+            self.session = httpx.Client(
+                timeout=timeout,
+                headers=self.headers,
+                transport=httpx.HTTPTransport(http2=True, retries=3),
+            )
+        else:
+            self.session = requests.Session()
+            # urllib3 lists br (and zstd) only when a decoder for it is installed
+            self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+            self.session.headers.update(self.headers)
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 503], raise_on_status=False),
+            )
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+        self._base = base_url.rstrip('/') + '/'
+        self._url = functools.lru_cache(maxsize=256)(self._build_url)
+
+    def _build_url(self, endpoint):
+        """
+        Builds the full URL for an endpoint. Wrapped in a per-instance LRU cache as ``_url``.
+
+        Args:
+            endpoint (str): The API endpoint.
+
+        Returns:
+            str: The full request URL.
+        """
+        return self._base + endpoint.lstrip('/')
+
+    def close(self):
+        """
+        Closes the underlying session and releases pooled connections.
+        """
+        self.session.close()
+
+    async def aclose(self):
+        """
+        Closes the asynchronous session, if one was created.
+        """
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
 
     def _handle_response(self, response):
         """
@@ -36,46 +120,125 @@ class APIClient:
             response (requests.Response): The HTTP response object.
 
         Returns:
-            dict: JSON response if the request was successful.
+            dict: JSON response if the request was successful, or the response
+                object itself when the body is empty (e.g. HEAD requests).
 
         Raises:
             HTTPError: If the HTTP request returned an unsuccessful status code.
+            ValueError: If the response body is not valid JSON.
         """
         try:
             response.raise_for_status()
-            return response.json()
-        except HTTPError as http_err:
-            logging.error(f'HTTP error occurred: {http_err}')
+            content = response.content
+            return _loads(content) if content else response
+        except _RESPONSE_ERRORS as err:
+            logging.error(f'Invalid response: {err}')
             raise
-        except ValueError as json_err:
-            logging.error(f'JSON decode error: {json_err}')
+
+    def _request(self, method, endpoint, params=None, body=None):
+        """
+        Sends an HTTP request with the specified method to the given endpoint.
+
+        Unset ``params`` / ``body`` are not forwarded at all, so the common
+        no-argument call builds no extra keyword arguments.
+
+        Args:
+            method (str): The HTTP method to use (e.g., 'GET', 'POST').
+            endpoint (str): The API endpoint to send the request to.
+            params (dict, optional): URL parameters to include in the request. Defaults to None.
+            body (dict, optional): Data to send as the JSON body. Defaults to None.
+
+        Returns:
+            dict: JSON response from the API.
+        """
+        url = self._url(endpoint)
+        request = self.session.request
+        timeout = self.timeout
+        try:
+            kwargs = {}
+            if params is not None:
+                kwargs['params'] = params
+            if body is not None:
+                kwargs['json'] = body
+            response = request(method, url, timeout=timeout, **kwargs)
+            return self._handle_response(response)
+        except _TIMEOUT_ERRORS:
+            logging.error('The request timed out')
             raise
-        except Exception as err:
-            logging.error(f'Other error occurred: {err}')
+        except _REQUEST_ERRORS as req_err:
+            logging.error(f'Request exception occurred: {req_err}')
             raise
 
-    def _request(self, method, endpoint, **kwargs):
+    async def _arequest(self, method, endpoint, params=None, body=None):
         """
-        Sends an HTTP request with the specified method to the given endpoint.
+        Sends an HTTP request asynchronously through a shared ``httpx.AsyncClient``.
+
+        Independent calls can be awaited together, e.g.
+        ``await asyncio.gather(*(client.aget(e) for e in endpoints))``.
 
         Args:
             method (str): The HTTP method to use (e.g., 'GET', 'POST').
             endpoint (str): The API endpoint to send the request to.
+            params (dict, optional): URL parameters to include in the request. Defaults to None.
+            body (dict, optional): Data to send as the JSON body. Defaults to None.
 
         Returns:
             dict: JSON response from the API.
+
+        Raises:
+            ImportError: If httpx is not installed.
         """
-        url = f"{self.base_url}/{endpoint}"
+        if httpx is None:
+            raise ImportError("Asynchronous requests require httpx (pip install httpx).")
+        if self._async_session is None:
+            self._async_session = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.headers,
+                transport=httpx.AsyncHTTPTransport(http2=self.use_http2, retries=3),
+            )
+        url = self._url(endpoint)
+        request = self._async_session.request
         try:
-            response = requests.request(method, url, headers=self.headers, timeout=self.timeout, **kwargs)
+            kwargs = {}
+            if params is not None:
+                kwargs['params'] = params
+            if body is not None:
+                kwargs['json'] = body
+            response = await request(method, url, **kwargs)
             return self._handle_response(response)
-        except Timeout:
+        except _TIMEOUT_ERRORS:
             logging.error('The request timed out')
             raise
-        except RequestException as req_err:
+        except _REQUEST_ERRORS as req_err:
             logging.error(f'Request exception occurred: {req_err}')
             raise
 
+    async def aget(self, endpoint, params=None):
+        """
+        Sends a GET request to the specified endpoint asynchronously.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            params (dict, optional): URL parameters to include in the request. Defaults to None.
+
+        Returns:
+            dict: JSON response from the API.
+        """
+        return await self._arequest('GET', endpoint, params=params)
+
+    async def apost(self, endpoint, data=None):
+        """
+        Sends a POST request to the specified endpoint asynchronously.
+
+        Args:
+            endpoint (str): The API endpoint to send the POST request to.
+            data (dict, optional): The data to include in the POST request. Defaults to None.
+
+        Returns:
+            dict: JSON response from the API.
+        """
+        return await self._arequest('POST', endpoint, body=data)
+
     def get(self, endpoint, params=None):
         """
         Sends a GET request to the specified endpoint.
@@ -100,7 +263,7 @@ class APIClient:
         Returns:
             dict: JSON response from the API.
         """
-        return self._request('POST', endpoint, json=data)
+        return self._request('POST', endpoint, body=data)
 
     def put(self, endpoint, data=None):
         """
@@ -113,7 +276,7 @@ class APIClient:
         Returns:
             dict: JSON response from the API.
         """
-        return self._request('PUT', endpoint, json=data)
+        return self._request('PUT', endpoint, body=data)
 
     def delete(self, endpoint):
         """
@@ -138,7 +301,7 @@ class APIClient:
         Returns:
             dict: JSON response from the API.
         """
-        return self._request('PATCH', endpoint, json=data)
+        return self._request('PATCH', endpoint, body=data)
 
     def head(self, endpoint, params=None):
         """
@@ -218,4 +381,6 @@ if __name__ == "__main__":
         response = client.options("posts/1")
         logging.info(response.headers)
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
\ No newline at end of file
+        logging.error(f"An error occurred: {e}")
+
+    client.close()
\ No newline at end of file
@@ -1,7 +1,18 @@
+import functools
+import json
 import requests
 import logging
-from requests.exceptions import HTTPError, ConnectionError, Timeout
-from time import sleep
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = json.loads
 
 logging.basicConfig(level=logging.INFO)
 
@@ -13,6 +24,7 @@ class APIClient:
         base_url (str): The base URL for the API.
         headers (dict): Default headers to include in each request.
         auth (tuple): Authentication credentials (optional).
+        session (requests.Session): Pooled session shared by all requests.
 
     Methods:
         get(endpoint, params): Sends a GET request to the specified endpoint.
@@ -24,7 +36,7 @@ class APIClient:
         options(endpoint, params): Sends an OPTIONS request to the specified endpoint.
     """
 
-    def __init__(self, base_url, headers=None, auth=None):
+    def __init__(self, base_url, headers=None, auth=None, retries=3):
         """
         Initializes the APIClient with a base URL, optional headers, and authentication.
 
@@ -32,10 +44,37 @@ class APIClient:
             base_url (str): The base URL for the API.
             headers (dict): Default headers to include in each request (optional).
             auth (tuple): Authentication credentials (optional).
+            retries (int): Retries for connection errors and 429/503 responses (default is 3).
         """
         self.base_url = base_url
         self.headers = headers if headers else {}
         self.auth = auth
+        self.session = requests.Session()
+        # urllib3 lists br (and zstd) only when a decoder for it is installed
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.session.headers.update(self.headers)
+        self.session.auth = auth
+        retry = Retry(
+            total=retries,
+            backoff_factor=1,
+            status_forcelist=(429, 503),  # Rate limit or service unavailable
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._base = base_url.rstrip('/') + '/'
+        self._url = functools.lru_cache(maxsize=256)(self._build_url)
+
+    def _build_url(self, endpoint):
+        """Builds the full URL for an endpoint. Wrapped in a per-instance LRU cache as ``_url``."""
+        return self._base + endpoint.lstrip('/')
+
+    def close(self):
+        """Closes the underlying session and releases pooled connections."""
+        self.session.close()
 
     def _handle_response(self, response):
         """Handles the API response, raising exceptions for errors."""
@@ -44,38 +83,32 @@ class APIClient:
         except HTTPError as http_err:
             logging.error(f'HTTP error occurred: {http_err} - Response: {response.text}')
             raise
-        except Exception as err:
-            logging.error(f'Other error occurred: {err}')
-            raise
+        content = response.content
+        if not content:
+            return ''
         try:
-            return response.json()
+            return _loads(content)
         except ValueError:
             return response.text
 
-    def _request_with_retries(self, method, endpoint, retries=3, **kwargs):
-        """Handles the request with retries for rate limiting."""
-        for attempt in range(retries):
-            try:
-                response = requests.request(method, self.base_url + endpoint, headers=self.headers, auth=self.auth, **kwargs)
-                return self._handle_response(response)
-            except (ConnectionError, Timeout) as err:
-                logging.warning(f'Attempt {attempt + 1} failed: {err}')
-                if attempt < retries - 1:
-                    sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    raise
-            except HTTPError as err:
-                if err.response.status_code in [429, 503]:  # Rate limit or service unavailable
-                    logging.warning(f'Rate limit error, attempt {attempt + 1}')
-                    if attempt < retries - 1:
-                        sleep(2 ** attempt)  # Exponential backoff
-                    else:
-                        raise
-                else:
-                    raise
-            except Exception as err:
-                logging.error(f'Unexpected error: {err}')
-                raise
+    def _send(self, method, endpoint, params=None, body=None):
+        """
+        Sends the request and returns the raw response; retries and backoff are handled by the session's adapter.
+
+        Unset ``params`` / ``body`` (the JSON payload) are not forwarded at all.
+        """
+        request = self.session.request
+        url = self._url(endpoint)
+        kwargs = {}
+        if params is not None:
+            kwargs['params'] = params
+        if body is not None:
+            kwargs['json'] = body
+        return request(method, url, **kwargs)
+
+    def _request(self, method, endpoint, params=None, body=None):
+        """Sends the request and returns the parsed response."""
+        return self._handle_response(self._send(method, endpoint, params, body))
 
     def get(self, endpoint, params=None):
         """
@@ -88,7 +121,7 @@ class APIClient:
         Returns:
             Any: The JSON response or text response.
         """
-        return self._request_with_retries('GET', endpoint, params=params)
+        return self._request('GET', endpoint, params=params)
 
     def post(self, endpoint, data=None):
         """
@@ -101,7 +134,7 @@ class APIClient:
         Returns:
             Any: The JSON response or text response.
         """
-        return self._request_with_retries('POST', endpoint, json=data)
+        return self._request('POST', endpoint, body=data)
 
     def put(self, endpoint, data=None):
         """
@@ -114,7 +147,7 @@ class APIClient:
         Returns:
             Any: The JSON response or text response.
         """
-        return self._request_with_retries('PUT', endpoint, json=data)
+        return self._request('PUT', endpoint, body=data)
 
     def delete(self, endpoint, params=None):
         """
@@ -127,7 +160,7 @@ class APIClient:
         Returns:
             Any: The JSON response or text response.
         """
-        return self._request_with_retries('DELETE', endpoint, params=params)
+        return self._request('DELETE', endpoint, params=params)
     
     def patch(self, endpoint, data=None):
         """
@@ -140,7 +173,7 @@ class APIClient:
         Returns:
             Any: The JSON response or text response.
         """
-        return self._request_with_retries('PATCH', endpoint, json=data)
+        return self._request('PATCH', endpoint, body=data)
     
     def head(self, endpoint, params=None):
         """
@@ -153,7 +186,8 @@ class APIClient:
         Returns:
             dict: The headers from the response.
         """
-        response = self._request_with_retries('HEAD', endpoint, params=params)
+        response = self._send('HEAD', endpoint, params=params)
+        self._handle_response(response)
         return response.headers
 
     def options(self, endpoint, params=None):
@@ -167,7 +201,7 @@ class APIClient:
         Returns:
             Any: The JSON response or text response.
         """
-        return self._request_with_retries('OPTIONS', endpoint, params=params)
+        return self._request('OPTIONS', endpoint, params=params)
 
     def authenticate(self, auth):
         """
@@ -177,6 +211,7 @@ class APIClient:
             auth (tuple): Authentication credentials.
         """
         self.auth = auth
+        self.session.auth = auth
 
 if __name__ == "__main__":
     # Example usage:
@@ -197,4 +232,6 @@ if __name__ == "__main__":
         response = api_client.post('/resource', data={'key': 'value'})
         print(response)
     except Exception as e:
-        logging.error(f'Error during POST request: {e}')
\ No newline at end of file
+        logging.error(f'Error during POST request: {e}')
+    finally:
+        api_client.close()
\ No newline at end of file
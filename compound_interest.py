@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch variant
+    np = None
+
+
 def calculate_compound_interest(principal: float, rate: float, times_compounded: int, years: int) -> float:
     """
     Calculate the compound interest based on the given principal, rate, times compounded per year, and number of years.
@@ -18,3 +24,35 @@ def calculate_compound_interest(principal: float, rate: float, times_compounded:
         raise ValueError("Invalid input types.")
     
     return amount
+
+
+def calculate_compound_interest_batch(principal, rate, times_compounded, years):
+    """
+    Calculate compound interest for many scenarios at once using NumPy.
+
+    Each argument may be a scalar or an array-like; they are broadcast against each other
+    and evaluated in a single vectorised expression.
+
+    :param principal: The initial amounts of money.
+    :param rate: The annual interest rates as decimals.
+    :param times_compounded: The number of times the interest is compounded per year.
+    :param years: The number of years the money is invested or borrowed for.
+    :return: A numpy.ndarray of accumulated amounts, one per broadcast scenario.
+    :raises ValueError: If any of the input values are invalid.
+    :raises ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("calculate_compound_interest_batch requires NumPy.")
+
+    try:
+        principal = np.asarray(principal, dtype=np.float64)
+        rate = np.asarray(rate, dtype=np.float64)
+        times_compounded = np.asarray(times_compounded, dtype=np.float64)
+        years = np.asarray(years, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid input types.")
+
+    if np.any((principal < 0) | (rate < 0) | (times_compounded <= 0) | (years < 0)):
+        raise ValueError("Inputs should be non-negative and times_compounded should be greater than zero.")
+
+    return principal * np.power(1.0 + rate / times_compounded, times_compounded * years)
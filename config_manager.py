@@ -1,5 +1,89 @@
+import copy
+import io
 import json
-from typing import Dict, Any
+import os
+import stat
+import threading
+from typing import BinaryIO, Dict, Any, Iterator, Tuple, Type, TypeVar
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(config: Dict[str, Any]) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = json.loads
+
+    def _dumps(config: Dict[str, Any]) -> bytes:
+        return json.dumps(config, indent=2).encode('utf-8')
+
+try:
+    import ijson
+
+    _STREAM_ERRORS: Tuple[type, ...] = (ijson.JSONError,)
+except ImportError:  # ijson is optional; large files are then parsed in one shot
+    ijson = None
+    _STREAM_ERRORS = ()
+
+# Files larger than this are parsed incrementally with ijson when it is available
+_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+
+def _is_object(file: BinaryIO) -> bool:
+    """Whether the JSON document in a binary file starts with an object. The file is rewound."""
+    while True:
+        chunk = file.read(io.DEFAULT_BUFFER_SIZE)
+        start = chunk.lstrip()
+        if start or not chunk:
+            break
+    file.seek(0)
+    return start[:1] == b'{'
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; only needed for read_config_typed
+    msgspec = None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; reflink backups are skipped there
+    fcntl = None
+
+# Linux ioctl that makes a copy-on-write clone of a file (Btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+T = TypeVar('T')
+
+# Parsed configurations keyed by path, tagged with the (mtime_ns, size) they were read at
+_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _hardlink(src: str, dst: str) -> bool:
+    """Hard-links dst to src, replacing an existing dst. Returns False if linking is not possible."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        os.remove(dst)
+        return _hardlink(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:  # cross-device, unsupported filesystem, no permission
+        return False
+    return True
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clones src to dst with FICLONE. Returns False if the filesystem cannot share extents."""
+    if fcntl is None:
+        return False
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except OSError:
+            return False
+    return True
 
 class ConfigManager:
     """
@@ -7,8 +91,17 @@ class ConfigManager:
 
     Methods
     -------
-    read_config(file_path: str) -> Dict[str, Any]:
+    read_config(file_path: str, mutable: bool = False) -> Dict[str, Any]:
         Reads configuration from a JSON file.
+
+    get(file_path: str, key: str, default: Any = None) -> Any:
+        Returns a single configuration value.
+
+    read_config_typed(file_path: str, schema: Type[T]) -> T:
+        Reads configuration from a JSON file into a typed msgspec schema.
+
+    read_config_stream(file_path: str, prefix: str = 'item') -> Iterator[Any]:
+        Lazily yields the items under a prefix of a large JSON file.
     
     write_config(file_path: str, config: Dict[str, Any]) -> None:
         Writes configuration to a JSON file.
@@ -21,14 +114,25 @@ class ConfigManager:
     """
 
     @staticmethod
-    def read_config(file_path: str) -> Dict[str, Any]:
+    def read_config(file_path: str, mutable: bool = False) -> Dict[str, Any]:
         """
         Reads configuration from a JSON file.
 
+        Parsed results are cached per path and reused until the file's
+        modification time or size changes. The cached dict itself is
+        returned and is shared by every caller, so it must be treated as
+        read-only; pass ``mutable=True`` for a private copy, which is parsed
+        afresh from the file (faster than deep-copying the cached tree).
+        Files above 8 MiB are parsed incrementally with ijson when it is
+        installed.
+
         Parameters
         ----------
         file_path : str
             The path to the configuration file.
+        mutable : bool, optional
+            Whether to return a freshly parsed dict the caller may modify
+            instead of the shared cached one (default False).
 
         Returns
         -------
@@ -42,19 +146,167 @@ class ConfigManager:
         json.JSONDecodeError
             If the configuration file contains invalid JSON.
         """
+        return ConfigManager._load(file_path, cached=not mutable)
+
+    @staticmethod
+    def get(file_path: str, key: str, default: Any = None) -> Any:
+        """
+        Returns a single configuration value.
+
+        The value is looked up in the cached configuration, so repeated
+        lookups cost one stat() and no parsing while the file is unchanged.
+        A list or dict value is shared with the cache and must not be
+        mutated.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the configuration file.
+        key : str
+            The configuration key to look up.
+        default : Any, optional
+            The value returned if the key is missing (default None).
+
+        Returns
+        -------
+        Any
+            The configuration value, or ``default``.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the configuration file is not found.
+        json.JSONDecodeError
+            If the configuration file contains invalid JSON.
+        """
+        return ConfigManager._load(file_path).get(key, default)
+
+    @staticmethod
+    def _load(file_path: str, cached: bool = True) -> Dict[str, Any]:
+        """
+        Returns the cached configuration for a path, parsing the file if the cache is stale.
+
+        The returned dict is shared with the cache and must not be mutated.
+        With ``cached=False`` the file is parsed into a new dict that bypasses
+        the cache entirely.
+        """
         try:
-            with open(file_path, 'r') as file:
-                return json.load(file)
+            st = os.stat(file_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            entry = _cache.get(file_path) if cached else None
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+            with open(file_path, 'rb') as file:
+                # kvitems only sees the members of a top-level object; anything else is parsed whole
+                if ijson is not None and st.st_size > _STREAM_THRESHOLD and _is_object(file):
+                    config = dict(ijson.kvitems(file, '', use_float=True))
+                else:
+                    config = _loads(file.read())
+            if cached:
+                _cache[file_path] = (stamp, config)
+            return config
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
         except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {file_path}") from e
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {file_path}", e.doc, e.pos) from e
+        except _STREAM_ERRORS as e:
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {file_path}", '', 0) from e
+
+    @staticmethod
+    def read_config_typed(file_path: str, schema: Type[T]) -> T:
+        """
+        Reads configuration from a JSON file into a typed msgspec schema.
+
+        The file is decoded and validated in one pass by msgspec, producing a
+        ``msgspec.Struct`` (or any other type msgspec supports) instead of a
+        dict, so no intermediate dictionary is built and values are accessed
+        as attributes.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the configuration file.
+        schema : Type[T]
+            The type to decode into, typically a ``msgspec.Struct`` subclass.
+
+        Returns
+        -------
+        T
+            The decoded configuration.
+
+        Raises
+        ------
+        ImportError
+            If msgspec is not installed.
+        FileNotFoundError
+            If the configuration file is not found.
+        json.JSONDecodeError
+            If the configuration file contains invalid JSON.
+        msgspec.ValidationError
+            If the configuration does not match the schema.
+        """
+        if msgspec is None:
+            raise ImportError("read_config_typed requires msgspec.")
+        try:
+            with open(file_path, 'rb') as file:
+                return msgspec.json.decode(file.read(), type=schema)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
+        except msgspec.ValidationError:
+            raise
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {file_path}", '', 0) from e
+
+    @staticmethod
+    def read_config_stream(file_path: str, prefix: str = 'item') -> Iterator[Any]:
+        """
+        Lazily yields the items found under a prefix of a JSON file.
+
+        Only one item is held in memory at a time, which suits multi-megabyte
+        files where the caller needs to iterate rather than load everything.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the JSON file.
+        prefix : str, optional
+            The ijson prefix of the items to yield (default ``'item'``, the
+            elements of a top-level array).
+
+        Yields
+        ------
+        Any
+            Each item found under ``prefix``.
+
+        Raises
+        ------
+        ImportError
+            If ijson is not installed.
+        FileNotFoundError
+            If the file is not found.
+        json.JSONDecodeError
+            If the file contains invalid JSON.
+        """
+        if ijson is None:
+            raise ImportError("read_config_stream requires ijson.")
+        try:
+            with open(file_path, 'rb') as file:
+                yield from ijson.items(file, prefix, use_float=True)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {file_path}", '', 0) from e
 
     @staticmethod
     def write_config(file_path: str, config: Dict[str, Any]) -> None:
         """
         Writes configuration to a JSON file.
 
+        The data is written to a temporary file in the same directory,
+        fsynced and then renamed over the target, so readers never observe a
+        partially written file. An existing file's permissions are kept.
+
         Parameters
         ----------
         file_path : str
@@ -67,11 +319,39 @@ class ConfigManager:
         IOError
             If there is an issue writing to the file.
         """
+        _cache.pop(file_path, None)
+        ConfigManager._write(file_path, config)
+
+    @staticmethod
+    def _write(file_path: str, config: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Atomically writes the configuration and returns the new file's (mtime_ns, size) stamp.
+        """
+        # Serialise up front so the file sees one contiguous write
+        data = _dumps(config)
+        # Unique per writer so concurrent writers never share a temporary file
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            with open(file_path, 'w') as file:
-                json.dump(config, file, indent=4)
+            # Unbuffered: the payload goes straight to write(), with no buffer-sized copy of it
+            with open(tmp_path, 'wb', buffering=0) as file:
+                view = memoryview(data)
+                while view:
+                    view = view[file.write(view):]
+                os.fsync(file.fileno())
+                # rename() keeps mtime and size, so this is also the target's stamp
+                st = os.fstat(file.fileno())
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, file_path)
         except IOError as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             raise IOError(f"Error writing to configuration file: {file_path}") from e
+        return st.st_mtime_ns, st.st_size
 
     @staticmethod
     def update_config(file_path: str, updates: Dict[str, Any]) -> None:
@@ -95,9 +375,11 @@ class ConfigManager:
             If there is an issue writing to the file.
         """
         try:
-            config = ConfigManager.read_config(file_path)
-            config.update(updates)
-            ConfigManager.write_config(file_path, config)
+            # Merge into a new dict so the cached (shared) copy is left untouched;
+            # updates are copied so later caller mutations cannot reach the cache
+            config = {**ConfigManager._load(file_path), **copy.deepcopy(updates)}
+            # Re-seed the cache so the next read does not parse the file again
+            _cache[file_path] = (ConfigManager._write(file_path, config), config)
         except (FileNotFoundError, json.JSONDecodeError, IOError) as e:
             raise e
 
@@ -106,6 +388,11 @@ class ConfigManager:
         """
         Creates a backup of the existing configuration file.
 
+        The backup is a hard link when possible. This is safe because
+        write_config replaces the file rather than rewriting it in place, so
+        the backup keeps the old contents. Otherwise a copy-on-write clone
+        is tried, and finally a regular copy.
+
         Parameters
         ----------
         file_path : str
@@ -121,6 +408,11 @@ class ConfigManager:
         import shutil
         backup_path = f"{file_path}.backup"
         try:
+            if _hardlink(file_path, backup_path):
+                return
+            if _reflink(file_path, backup_path):
+                shutil.copymode(file_path, backup_path)
+                return
             shutil.copy(file_path, backup_path)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
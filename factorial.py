@@ -1,6 +1,9 @@
+import math
+
+
 def calculate_factorial(n: int) -> int:
     """
-    Calculate the factorial of a non-negative integer using an iterative approach.
+    Calculate the factorial of a non-negative integer using math.factorial (C, binary splitting).
 
     Parameters:
     n (int): A non-negative integer whose factorial is to be calculated.
@@ -13,15 +16,13 @@ def calculate_factorial(n: int) -> int:
     """
     if n < 0:
         raise ValueError("Input must be a non-negative integer.")
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    return math.factorial(n)
 
-# Example usage
-print(calculate_factorial(5))  # Output: 120
-print(calculate_factorial(0))  # Output: 1
-try:
-    calculate_factorial(-1)
-except ValueError as e:
-    print(e)  # Output: ValueError: Input must be a non-negative integer.
+if __name__ == "__main__":
+    # Example usage
+    print(calculate_factorial(5))  # Output: 120
+    print(calculate_factorial(0))  # Output: 1
+    try:
+        calculate_factorial(-1)
+    except ValueError as e:
+        print(e)  # Output: ValueError: Input must be a non-negative integer.
@@ -1,6 +1,35 @@
+import io
+import locale
+import mmap
 import os
 import shutil
 
+# Files at least this large are decoded straight from a memory map in read_file
+MMAP_THRESHOLD = 1 << 20
+
+# Upper bound for the write buffer used by create_file/update_file
+MAX_WRITE_BUFFER = 1 << 20
+
+
+def _write_buffering(content):
+    """Returns a buffer size that lets the content reach the OS in as few write calls as possible."""
+    return min(max(len(content), io.DEFAULT_BUFFER_SIZE), MAX_WRITE_BUFFER)
+
+
+def _decode_text(data):
+    """Decodes file bytes the way text-mode open() would, including universal newlines."""
+    content = str(data, locale.getpreferredencoding(False))
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _encode_text(content, encoding):
+    """Encodes text the way text-mode open() would, translating newlines to os.linesep."""
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode(encoding)
+
 def create_file(file_path, content, overwrite=True):
     """
     Creates a new file at the specified path with the given content. 
@@ -18,7 +47,7 @@ def create_file(file_path, content, overwrite=True):
     """
     mode = 'w' if overwrite else 'x'
     try:
-        with open(file_path, mode) as file:
+        with open(file_path, mode, buffering=_write_buffering(content)) as file:
             file.write(content)
     except FileNotFoundError:
         raise FileNotFoundError(f"Directory does not exist for file {file_path}")
@@ -27,10 +56,48 @@ def create_file(file_path, content, overwrite=True):
     except FileExistsError:
         raise FileExistsError(f"File {file_path} already exists and overwrite is set to False")
 
+def create_files_bulk(items, overwrite=True):
+    """
+    Creates several files, each written with a single unbuffered write.
+
+    This is the recommended path when many files are produced at once: every
+    file's content is encoded up front (newlines translated as create_file's
+    text mode does) and handed to the OS in one write call, with no
+    intermediate text or buffer layer per file.
+
+    Args:
+        items (Iterable[tuple[str, str]]): (file_path, content) pairs to create.
+        overwrite (bool): Whether to overwrite files that already exist.
+
+    Raises:
+        FileNotFoundError: If the directory doesn't exist for a file.
+        PermissionError: If a file can't be created due to permission issues.
+        FileExistsError: If a file exists and overwrite is False.
+    """
+    mode = 'wb' if overwrite else 'xb'
+    encoding = locale.getpreferredencoding(False)
+    for file_path, content in items:
+        data = memoryview(_encode_text(content, encoding))
+        try:
+            with open(file_path, mode, buffering=0) as file:
+                # Raw writes may be partial, so loop until everything is written
+                while data:
+                    data = data[file.write(data):]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Directory does not exist for file {file_path}")
+        except PermissionError:
+            raise PermissionError(f"Permission denied to create file {file_path}")
+        except FileExistsError:
+            raise FileExistsError(f"File {file_path} already exists and overwrite is set to False")
+
 def read_file(file_path):
     """
     Reads the content of the specified file and returns it as a string.
 
+    Smaller files are read unbuffered in a single read call; files of
+    MMAP_THRESHOLD bytes or more are memory-mapped and decoded directly from
+    the mapping, skipping the intermediate bytes copy.
+
     Args:
         file_path (str): The path of the file to read.
 
@@ -42,8 +109,11 @@ def read_file(file_path):
         PermissionError: If the file can't be read due to permission issues.
     """
     try:
-        with open(file_path, 'r') as file:
-            return file.read()
+        with open(file_path, 'rb', buffering=0) as file:
+            if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+                return _decode_text(file.readall())
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _decode_text(mapped)
     except FileNotFoundError:
         raise FileNotFoundError(f"File {file_path} does not exist")
     except PermissionError:
@@ -62,7 +132,7 @@ def update_file(file_path, new_content):
         PermissionError: If the file can't be updated due to permission issues.
     """
     try:
-        with open(file_path, 'a') as file:
+        with open(file_path, 'a', buffering=_write_buffering(new_content)) as file:
             file.write(new_content)
     except FileNotFoundError:
         raise FileNotFoundError(f"File {file_path} does not exist")
@@ -131,15 +201,15 @@ def delete_directory(directory_path, recursive=False):
 if __name__ == "__main__":
     # Example usage
     try:
-        create_file('example.txt', 'Hello, World!')
-        content = read_file('example.txt')
-        if content:
-            print(content)
-        update_file('example.txt', '\nThis is an update.')
+        # Write the final content once instead of creating and then appending
+        create_file('example.txt', 'Hello, World!\nThis is an update.')
         content = read_file('example.txt')
         if content:
             print(content)
         delete_file('example.txt')
+        create_files_bulk([('example_1.txt', 'First file'), ('example_2.txt', 'Second file')])
+        delete_file('example_1.txt')
+        delete_file('example_2.txt')
         create_directory('example_dir')
         delete_directory('example_dir')
     except (FileNotFoundError, PermissionError, OSError) as e:
@@ -1,6 +1,16 @@
 import os
+import re
 import shutil
+import stat
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Largest chunk handed to os.copy_file_range per call
+_COPY_CHUNK = 1 << 30
+
+def _open_nonblocking(path, flags):
+    """``open()`` opener adding O_NONBLOCK, so opening a FIFO returns at once instead of waiting for a writer."""
+    return os.open(path, flags | getattr(os, 'O_NONBLOCK', 0))
 
 def list_directory_contents(path):
     """
@@ -10,9 +20,41 @@ def list_directory_contents(path):
     :return: List of directory contents.
     :raises ValueError: If the path is not a valid directory.
     """
-    if not os.path.isdir(path):
-        raise ValueError(f"The path '{path}' is not a valid directory.")
-    return os.listdir(path)
+    try:
+        return os.listdir(path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise ValueError(f"The path '{path}' is not a valid directory.") from e
+
+def _copy_contents(fsrc, dst):
+    """
+    Copy file contents from an open source file to ``dst`` inside the kernel where possible.
+
+    Uses ``os.copy_file_range`` (Linux), which avoids user-space buffers and
+    becomes a reflink on copy-on-write filesystems; falls back to a chunked
+    ``shutil.copyfileobj`` when the call is unavailable or unsupported.
+
+    :param fsrc: Source file opened in binary mode.
+    :param dst: Destination file path.
+    :raises shutil.SameFileError: If ``dst`` is the source file itself.
+    """
+    try:
+        if os.path.samestat(os.fstat(fsrc.fileno()), os.stat(dst)):
+            raise shutil.SameFileError(f"{fsrc.name!r} and {dst!r} are the same file")
+    except FileNotFoundError:
+        pass
+    with open(dst, 'wb', buffering=0) as fdst:
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        if copy_file_range is not None:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            try:
+                while copy_file_range(in_fd, out_fd, _COPY_CHUNK):
+                    pass
+                return
+            except OSError:
+                # e.g. EXDEV on older kernels, or a filesystem without support
+                pass
+        # Both offsets have advanced together, so this resumes where the kernel copy stopped
+        shutil.copyfileobj(fsrc, fdst, 1 << 20)
 
 def copy_file(src, dst):
     """
@@ -22,10 +64,21 @@ def copy_file(src, dst):
     :param dst: Destination file path.
     :raises ValueError: If the source path is not a valid file.
     """
-    if not os.path.isfile(src):
-        raise ValueError(f"The source path '{src}' is not a valid file.")
-    os.makedirs(os.path.dirname(dst), exist_ok=True)
-    shutil.copy2(src, dst)
+    try:
+        fsrc = open(src, 'rb', buffering=0, opener=_open_nonblocking)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+        raise ValueError(f"The source path '{src}' is not a valid file.") from e
+    with fsrc:
+        # Checked on the open descriptor: FIFOs, devices and sockets are not copied
+        if not stat.S_ISREG(os.fstat(fsrc.fileno()).st_mode):
+            raise ValueError(f"The source path '{src}' is not a valid file.")
+        parent = os.path.dirname(dst)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        _copy_contents(fsrc, dst)
+    shutil.copystat(src, dst)
 
 def move_file(src, dst):
     """
@@ -44,15 +97,19 @@ def delete_path(path):
     """
     Delete a file or directory.
 
+    A symbolic link is removed itself; the file or directory it points to is left alone.
+
     :param path: Path to the file or directory.
     :raises ValueError: If the path does not exist.
     """
-    if not os.path.exists(path):
-        raise ValueError(f"The path '{path}' does not exist.")
-    if os.path.isfile(path):
-        os.remove(path)
-    else:
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError as e:
+        raise ValueError(f"The path '{path}' does not exist.") from e
+    if stat.S_ISDIR(st.st_mode):
         shutil.rmtree(path)
+    else:
+        os.remove(path)
 
 def check_disk_usage(path):
     """
@@ -67,18 +124,119 @@ def check_disk_usage(path):
     total, used, free = shutil.disk_usage(path)
     return {'total': total, 'used': used, 'free': free}
 
-def search_files(directory, pattern):
+def _scan_entries(entries, match):
+    """
+    Split directory entries into matching files and subdirectories to descend into.
+
+    Entries are classified with ``DirEntry`` methods so no extra ``stat`` is needed per
+    entry; directory symlinks are not followed, matching ``os.walk``.
+
+    :param entries: An ``os.scandir`` iterator.
+    :param match: Callable taking a normalised file name, truthy on a match.
+    :return: Tuple of (matching file paths, subdirectory paths).
+    """
+    normcase = os.path.normcase
+    files, subdirs = [], []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif match(normcase(entry.name)):
+            files.append(entry.path)
+    return files, subdirs
+
+def _scan_directory(directory, match):
+    """
+    List one directory with ``_scan_entries``; unreadable directories are skipped like ``os.walk`` does.
+
+    :param directory: Directory path to list.
+    :param match: Callable taking a normalised file name, truthy on a match.
+    :return: Tuple of (matching file paths, subdirectory paths); both empty if unreadable.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return _scan_entries(entries, match)
+    except OSError:
+        return [], []
+
+def _walk_matches(files, subdirs, match):
+    """
+    Yield an already scanned directory's matches, then walk its subdirectories top-down like ``os.walk``.
+
+    :param files: Matching file paths of the scanned directory.
+    :param subdirs: Subdirectory paths of the scanned directory.
+    :param match: Callable taking a normalised file name, truthy on a match.
+    """
+    yield from files
+    # Reversed so subdirectories are visited in listing order
+    pending = subdirs[::-1]
+    while pending:
+        files, subdirs = _scan_directory(pending.pop(), match)
+        yield from files
+        pending.extend(reversed(subdirs))
+
+def _walk_tree(directory, match):
+    """
+    Collect every match under a directory into a list (the unit of work for worker threads).
+
+    :param directory: Directory path to walk.
+    :param match: Callable taking a normalised file name, truthy on a match.
+    :return: List of matching file paths.
+    """
+    return list(_walk_matches(*_scan_directory(directory, match), match))
+
+def _walk_matches_parallel(files, subdirs, match, max_workers):
+    """
+    Yield an already scanned directory's matches, walking each subdirectory in its own worker thread.
+
+    ``os.scandir`` releases the GIL, so metadata lookups in different subtrees overlap.
+    Results from a subtree are yielded as soon as that subtree finishes.
+
+    :param files: Matching file paths of the scanned directory.
+    :param subdirs: Subdirectory paths of the scanned directory.
+    :param match: Callable taking a normalised file name, truthy on a match.
+    :param max_workers: Maximum number of worker threads.
+    """
+    yield from files
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [pool.submit(_walk_tree, subdir, match) for subdir in subdirs]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def search_files(directory, pattern, max_workers=None):
     """
     Search for files matching a pattern in a directory.
 
+    The directory is validated immediately; matches are produced lazily as the
+    tree is walked, so wrap the result in ``list()`` if a list is needed.
+
     :param directory: Directory path to search in.
     :param pattern: Pattern to match files.
-    :return: List of matching files with their full paths.
+    :param max_workers: If given, walk top-level subdirectories concurrently with this many
+        threads (useful on NVMe or network filesystems); matches then arrive in completion
+        order rather than walk order. Defaults to a sequential walk.
+    :return: Iterator over matching files with their full paths.
     :raises ValueError: If the directory is not valid.
     """
-    if not os.path.isdir(directory):
-        raise ValueError(f"The directory '{directory}' is not valid.")
-    return [os.path.join(root, name) for root, _, files in os.walk(directory) for name in fnmatch.filter(files, pattern)]
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    try:
+        with os.scandir(directory) as entries:
+            files, subdirs = _scan_entries(entries, match)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise ValueError(f"The directory '{directory}' is not valid.") from e
+    except OSError:
+        # Unreadable, as os.walk would silently skip it
+        files, subdirs = [], []
+    if max_workers is not None:
+        return _walk_matches_parallel(files, subdirs, match, max_workers)
+    return _walk_matches(files, subdirs, match)
 
 if __name__ == "__main__":
     # Example usage
@@ -113,7 +271,7 @@ if __name__ == "__main__":
         print(f"Error checking disk usage: {e}")
 
     try:
-        files = search_files('/path/to/directory', 'pattern*')
+        files = list(search_files('/path/to/directory', 'pattern*'))
         print("Matching Files:", files)
     except Exception as e:
         print(f"Error searching for files: {e}")
\ No newline at end of file
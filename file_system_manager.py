@@ -12,6 +12,8 @@ This module includes functionality for:
 - Deleting files and directories
 - Listing contents of directories
 - Moving and copying files and directories
+- Queueing reads and writes in the background and draining them with flush()
+- Awaitable versions of the file operations for asyncio code
 
 All functions include comprehensive error handling and follow the PEP 8 style guide.
 
@@ -43,41 +45,499 @@ Example usage:
     fsm.copy('new_directory/example.txt', 'example_copy.txt')
 """
 
+import asyncio
+import atexit
+import errno
+import functools
+import io
+import logging
+import mmap
 import os
 import shutil
+import stat
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Set, Dict, Tuple, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached stat result answers file_exists/directory_exists/get_file_size
+STAT_CACHE_TTL = 0.5
+# The cache is emptied when it reaches this many paths
+_STAT_CACHE_MAX = 4096
+# Path -> (time.monotonic() when taken, os.stat result or None if the path was missing)
+_stat_cache: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}
+# Directories create_directory has made or found, with their parents; it returns early for these
+_known_dirs: Set[str] = set()
+
+# Files at least this large are read through a memory map
+MMAP_THRESHOLD = 1 << 20
+
+# Page-aligned buffer size for direct=True (O_DIRECT) reads
+_DIRECT_CHUNK = 1 << 20
+
+# Largest chunk handed to os.copy_file_range / os.sendfile per call
+_COPY_CHUNK = 16 * 1024 * 1024
+
+# Encoded content shorter than this is written with os.write, skipping the io stack
+_SMALL_WRITE = 64 * 1024
+
+# Extra os.open flags for writes. Each is 0 where the platform lacks it: O_CLOEXEC is POSIX-only, and
+# O_BINARY (Windows) stops the C runtime translating newlines again after _encode_text has done so
+_OPEN_FLAGS = getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+# Directory copies with more files than this copy them on a thread pool
+_PARALLEL_COPY_MIN_FILES = 16
+
+# Buffer size of the handles kept open by append_to_file(..., buffered=True)
+APPEND_BUFFER_SIZE = 32 * 1024
+# Path -> append handle kept open across buffered appends; see flush_appends()
+_append_handles: Dict[str, io.BufferedWriter] = {}
+_append_lock = threading.Lock()
+
+# Background I/O pool, created on first use by the *_async functions
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# Futures submitted but not yet finished; drained by flush()
+_pending: Set[Future] = set()
+# preadv(..., RWF_NOWAIT) is Linux-only; elsewhere every async read goes to the pool
+_RWF_NOWAIT = getattr(os, 'RWF_NOWAIT', None)
+
+
+def _s(path: Union[str, Path]) -> str:
+    """
+    Return a path as a str, without any conversion when it already is one.
+
+    Parameters:
+    path (Union[str, Path]): The path.
+
+    Returns:
+    str: The path as a string.
+    """
+    return path if type(path) is str else os.fspath(path)
+
+
+# Encoded file system form of recently used path strings. Encoding is a pure
+# function of the string, so entries never go stale; only the size is bounded.
+_encoded = functools.lru_cache(maxsize=4096)(os.fsencode)
+
+
+def _cached_stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """
+    Return os.stat(path), reusing a result taken less than STAT_CACHE_TTL seconds ago.
+
+    Symbolic links are followed, as with Path.is_file() and os.path.getsize().
+
+    Parameters:
+    path (Union[str, Path]): The path to stat.
+
+    Returns:
+    Optional[os.stat_result]: The stat result, or None if the path could not be stat'ed.
+    """
+    key = _s(path)
+    now = time.monotonic()
+    hit = _stat_cache.get(key)
+    if hit is not None and now - hit[0] < STAT_CACHE_TTL:
+        return hit[1]
+    try:
+        result = os.stat(_encoded(key))
+    except (OSError, ValueError):
+        result = None
+    if len(_stat_cache) >= _STAT_CACHE_MAX:
+        _stat_cache.clear()
+    _stat_cache[key] = (now, result)
+    return result
+
+
+def invalidate(path: Union[str, Path]) -> None:
+    """
+    Drop the cached stat result for a path.
+
+    This module's own write, delete, create, move and copy functions do this
+    themselves. Call it after changing a path by other means when the change
+    must be visible before STAT_CACHE_TTL expires.
+
+    Parameters:
+    path (Union[str, Path]): The path whose cached stat result is dropped.
+    """
+    _stat_cache.pop(_s(path), None)
+
+
+def clear_stat_cache() -> None:
+    """
+    Drop every cached stat result and every directory create_directory remembers.
+    """
+    _stat_cache.clear()
+    _known_dirs.clear()
+
+
+def _decode_text(data) -> str:
+    """
+    Decode UTF-8 bytes the way open(..., 'r', encoding='utf-8') would, including universal newlines.
+
+    Parameters:
+    data (bytes-like): The raw file content.
+
+    Returns:
+    str: The decoded text.
+    """
+    content = str(data, 'utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _encode_text(content: str) -> bytes:
+    """
+    Encode text the way open(..., 'w', encoding='utf-8') would, translating newlines to os.linesep.
+
+    Parameters:
+    content (str): The text to encode.
+
+    Returns:
+    bytes: The encoded content.
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode('utf-8')
+
+
+def _open_bytes(file_path: Union[str, Path]) -> memoryview:
+    """
+    Return a read-only view of a file's bytes: a single read for small files, a memory map for large ones.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    memoryview: The file's bytes. Releasing the view unmaps a mapped file.
+
+    Raises:
+    OSError: If the file cannot be opened, read or mapped.
+    """
+    with open(file_path, 'rb', buffering=0) as file:
+        if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+            return memoryview(file.readall())
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, 'madvise'):
+        # Whole-file reads are linear, so let the kernel read ahead aggressively
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    # The view keeps the mapping alive; it is unmapped once the view is released and collected
+    return memoryview(mapped)
+
+
+def _read_cached(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Read a file without blocking, succeeding only if all of it is in the page cache.
+
+    Uses preadv with RWF_NOWAIT, which returns cached data inline and fails
+    with EAGAIN (or a short read) instead of waiting for the disk.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    Optional[str]: The content of the file, or None if it could not be read without blocking.
+    """
+    if _RWF_NOWAIT is None:
+        return None
+    try:
+        fd = os.open(_encoded(_s(file_path)), os.O_RDONLY)
+    except (OSError, ValueError):
+        return None
+    try:
+        size = os.fstat(fd).st_size
+        # Size 0 also covers procfs-style files whose real length is unknown
+        if size == 0:
+            return None
+        buffer = bytearray(size)
+        if os.preadv(fd, [buffer], 0, _RWF_NOWAIT) != size:
+            return None
+        return _decode_text(buffer)
+    except (OSError, UnicodeDecodeError):
+        # EAGAIN when not cached, EOPNOTSUPP on filesystems without RWF_NOWAIT;
+        # read_from_file reports real errors
+        return None
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of data to a file descriptor, retrying after partial writes.
+
+    Parameters:
+    fd (int): The file descriptor to write to.
+    data (bytes): The bytes to write.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _copy_contents(fsrc, fdst) -> None:
+    """
+    Copy the rest of fsrc into fdst, keeping the data inside the kernel where possible.
+
+    Tries os.copy_file_range (Linux; a reflink on copy-on-write filesystems),
+    then os.sendfile, then a chunked user-space copy. Each step resumes where
+    the previous one stopped, because both file offsets advance together.
+
+    Parameters:
+    fsrc (BinaryIO): The source file, opened for binary reading.
+    fdst (BinaryIO): The destination file, opened for binary writing.
+    """
+    in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            while copy_file_range(in_fd, out_fd, _COPY_CHUNK):
+                pass
+            return
+        except OSError:
+            # ENOSYS/EXDEV/EINVAL: kernel or filesystem without support
+            pass
+    try:
+        while os.sendfile(out_fd, in_fd, None, _COPY_CHUNK):
+            pass
+        return
+    except (AttributeError, OSError):
+        pass
+    shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
+def _open_direct(file_path: Union[str, Path]) -> Optional[int]:
+    """
+    Open a file for reading with O_DIRECT, bypassing the page cache.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    Optional[int]: The file descriptor, or None if the platform or filesystem does not support O_DIRECT.
+
+    Raises:
+    OSError: If the file cannot be opened for any other reason.
+    """
+    o_direct = getattr(os, 'O_DIRECT', None)
+    if o_direct is None:
+        return None
+    try:
+        return os.open(file_path, os.O_RDONLY | o_direct)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return None
+        raise
+
+
+def _read_direct(fd: int, sink) -> bool:
+    """
+    Read an O_DIRECT file descriptor to the end through one page-aligned buffer.
+
+    Parameters:
+    fd (int): A descriptor returned by _open_direct.
+    sink (Callable[[memoryview], None]): Called with each chunk; the view is reused, so copy or write it at once.
+
+    Returns:
+    bool: True once the whole file was read, False if the filesystem rejected the first direct read.
+    """
+    size = os.fstat(fd).st_size
+    done = 0
+    # Anonymous maps are page-aligned, which satisfies O_DIRECT's alignment rules
+    with mmap.mmap(-1, _DIRECT_CHUNK) as buffer:
+        while done < size:
+            try:
+                count = os.readv(fd, [buffer])
+            except OSError as e:
+                if e.errno == errno.EINVAL and done == 0:
+                    return False
+                raise
+            if count == 0:
+                break
+            with memoryview(buffer) as view:
+                sink(view[:count])
+            done += count
+    return True
+
+
+def _copy_file(src_path: Union[str, Path], dest_path: Union[str, Path], direct: bool = False) -> None:
+    """
+    Copy a file's contents and metadata like shutil.copy2, without routing the data through Python.
+
+    Parameters:
+    src_path (Union[str, Path]): The source file.
+    dest_path (Union[str, Path]): The destination file, or a directory to copy into.
+    direct (bool): Read with O_DIRECT and drop the written pages from the cache (see copy()).
+
+    Raises:
+    shutil.SameFileError: If the destination is the source file itself.
+    OSError: If either file cannot be opened, copied or updated.
+    """
+    if os.path.isdir(dest_path):
+        dest_path = os.path.join(dest_path, os.path.basename(src_path))
+    with open(src_path, 'rb', buffering=0) as fsrc:
+        try:
+            if os.path.samestat(os.fstat(fsrc.fileno()), os.stat(dest_path)):
+                raise shutil.SameFileError(f"{src_path!r} and {dest_path!r} are the same file")
+        except FileNotFoundError:
+            pass
+        with open(dest_path, 'wb', buffering=0) as fdst:
+            if not (direct and _copy_direct(src_path, fdst.fileno())):
+                _copy_contents(fsrc, fdst)
+    shutil.copystat(src_path, dest_path)
+
+
+def _copy_direct(src_path: Union[str, Path], out_fd: int) -> bool:
+    """
+    Copy a file through the O_DIRECT reader, then flush the copy and drop it from the page cache.
+
+    Parameters:
+    src_path (Union[str, Path]): The source file.
+    out_fd (int): The destination, open for writing at offset 0.
+
+    Returns:
+    bool: True if the file was copied, False if O_DIRECT is unsupported and nothing was written.
+    """
+    in_fd = _open_direct(src_path)
+    if in_fd is None:
+        return False
+    try:
+        if not _read_direct(in_fd, lambda chunk: _write_all(out_fd, chunk)):
+            return False
+    finally:
+        os.close(in_fd)
+    if hasattr(os, 'posix_fadvise'):
+        # Only clean pages can be dropped, so write the copy out first
+        os.fdatasync(out_fd)
+        os.posix_fadvise(out_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return True
+
+
+def _copytree_parallel(
+    src_path: Union[str, Path], dest_path: Union[str, Path], workers: int = 8, direct: bool = False
+) -> None:
+    """
+    Copy a directory tree like shutil.copytree, copying its files concurrently.
+
+    The tree is walked first and its directories created. The files are then
+    copied with _copy_file, on up to ``workers`` threads when there are more
+    than _PARALLEL_COPY_MIN_FILES of them, so several copies are in flight at
+    once. Directory metadata is copied last so the new files do not change it.
+    As with shutil.copytree, symbolic links are followed.
+
+    Parameters:
+    src_path (Union[str, Path]): The source directory.
+    dest_path (Union[str, Path]): The destination directory, which must not exist.
+    workers (int): Maximum number of copy threads (default is 8).
+    direct (bool): Passed on to _copy_file for every file (default is False).
+
+    Raises:
+    FileExistsError: If the destination already exists.
+    OSError: The first error hit while copying; pending copies are cancelled.
+    """
+    os.makedirs(dest_path)
+    directories, files = [], []
+    pending = [(_s(src_path), _s(dest_path))]
+    while pending:
+        src_dir, dest_dir = pending.pop()
+        directories.append((src_dir, dest_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dest_dir, entry.name)
+                if entry.is_dir():
+                    os.mkdir(target)
+                    pending.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+    if len(files) > _PARALLEL_COPY_MIN_FILES:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for future in as_completed([pool.submit(_copy_file, src, dest, direct) for src, dest in files]):
+                future.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+    else:
+        for src, dest in files:
+            _copy_file(src, dest, direct)
+    for src_dir, dest_dir in reversed(directories):
+        shutil.copystat(src_dir, dest_dir)
+
+
+def _submit(fn, *args) -> Future:
+    """
+    Run fn(*args) on the background I/O pool and track it until it finishes.
+
+    Parameters:
+    fn (Callable): The blocking function to run.
+    *args: Arguments passed to fn.
+
+    Returns:
+    Future: A future resolving to fn's return value.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix='fsm-io')
+    future = _executor.submit(fn, *args)
+    _pending.add(future)
+    future.add_done_callback(_pending.discard)
+    return future
 
 
 def file_exists(file_path: Union[str, Path]) -> bool:
     """
     Check if a file exists at the specified path.
 
+    Repeated checks within STAT_CACHE_TTL seconds reuse one cached stat result.
+
     Parameters:
     file_path (Union[str, Path]): The path to the file.
 
     Returns:
     bool: True if the file exists, False otherwise.
     """
-    return Path(file_path).is_file()
+    result = _cached_stat(file_path)
+    return result is not None and stat.S_ISREG(result.st_mode)
 
 
 def create_directory(directory_path: Union[str, Path]) -> bool:
     """
     Create a directory at the specified path.
 
+    Directories created (or found to exist) by an earlier call are remembered,
+    along with their parents, and later calls for them return immediately
+    without touching the file system. delete_directory and move forget them;
+    call clear_stat_cache() if they are removed by other means.
+
     Parameters:
     directory_path (Union[str, Path]): The path to the directory.
 
     Returns:
     bool: True if the directory was created successfully, False otherwise.
     """
-    try:
-        Path(directory_path).mkdir(parents=True, exist_ok=True)
+    key = _s(directory_path)
+    if key in _known_dirs:
         return True
-    except Exception as e:
-        print(f"Error creating directory: {e}")
+    try:
+        os.makedirs(key, exist_ok=True)
+    except OSError as e:
+        logger.warning("Error creating directory: %s", e)
         return False
+    finally:
+        # Missing parents are created too
+        _stat_cache.clear()
+    if len(_known_dirs) >= _STAT_CACHE_MAX:
+        _known_dirs.clear()
+    while key and key not in _known_dirs:
+        _known_dirs.add(key)
+        parent = os.path.dirname(key)
+        if parent == key:
+            break
+        key = parent
+    return True
 
 
 def write_to_file(file_path: Union[str, Path], content: str) -> bool:
@@ -92,32 +552,214 @@ def write_to_file(file_path: Union[str, Path], content: str) -> bool:
     bool: True if writing to the file was successful, False otherwise.
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
+        # Encoded like text mode on both paths, so the bytes on disk do not depend on the size
+        data = _encode_text(content)
+        _drop_append_handles(file_path)
+        if len(data) < _SMALL_WRITE:
+            # Skip the text and buffer layers; mode 0o666 is what open() passes too
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _OPEN_FLAGS, 0o666)
+            try:
+                _write_all(fd, data)
+            finally:
+                os.close(fd)
+        else:
+            with open(file_path, 'wb') as file:
+                file.write(data)
         return True
-    except Exception as e:
-        print(f"Error writing to file: {e}")
+    except (OSError, UnicodeEncodeError) as e:
+        logger.warning("Error writing to file: %s", e)
         return False
+    finally:
+        invalidate(file_path)
 
 
-def read_from_file(file_path: Union[str, Path]) -> Optional[str]:
+def write_to_file_durable(file_path: Union[str, Path], content: str) -> bool:
+    """
+    Write content to a file and make sure it is on stable storage before returning.
+
+    The data is written with os.write and flushed with fsync on the same
+    descriptor. When the file is newly created, its directory is fsync'ed too
+    (on platforms that can open directories), so the new entry also survives
+    a crash.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+    content (str): The content to write to the file.
+
+    Returns:
+    bool: True if the content was written and flushed successfully, False otherwise.
+    """
+    try:
+        data = _encode_text(content)
+        _drop_append_handles(file_path)
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _OPEN_FLAGS, 0o666)
+            created = True
+        except FileExistsError:
+            fd = os.open(file_path, os.O_WRONLY | os.O_TRUNC | _OPEN_FLAGS)
+            created = False
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Windows cannot open a directory with os.open, so only the file itself is fsync'ed there
+        if created and hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(os.path.dirname(_s(file_path)) or '.', os.O_RDONLY | os.O_DIRECTORY | _OPEN_FLAGS)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        return True
+    except (OSError, UnicodeEncodeError) as e:
+        logger.warning("Error writing to file: %s", e)
+        return False
+    finally:
+        invalidate(file_path)
+
+
+def read_from_file(file_path: Union[str, Path], direct: bool = False) -> Optional[str]:
     """
     Read content from a file.
 
+    Files of MMAP_THRESHOLD bytes or more are decoded straight from a
+    read-only memory map, skipping the intermediate bytes copy. With
+    direct=True the file is read with O_DIRECT instead, bypassing the page
+    cache, for one-off reads of files that will not be read again; it falls
+    back to the normal path on filesystems without O_DIRECT.
+
     Parameters:
     file_path (Union[str, Path]): The path to the file.
+    direct (bool): Bypass the page cache (default is False).
 
     Returns:
     Optional[str]: The content of the file, or None if an error occurred.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
-    except Exception as e:
-        print(f"Error reading from file: {e}")
+        if direct:
+            fd = _open_direct(file_path)
+            if fd is not None:
+                chunks: List[bytes] = []
+                try:
+                    ok = _read_direct(fd, lambda chunk: chunks.append(bytes(chunk)))
+                finally:
+                    os.close(fd)
+                if ok:
+                    return _decode_text(b''.join(chunks))
+        with _open_bytes(file_path) as data:
+            return _decode_text(data)
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning("Error reading from file: %s", e)
+        return None
+
+
+def read_from_file_bytes(file_path: Union[str, Path]) -> Optional[memoryview]:
+    """
+    Read the raw bytes of a file without decoding them.
+
+    Files of MMAP_THRESHOLD bytes or more are memory-mapped rather than copied,
+    so code that only scans the data never materialises it in full. Release
+    the view (or use it in a with block) when done to unmap the file.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    Optional[memoryview]: A read-only view of the file's bytes, or None if an error occurred.
+    """
+    try:
+        return _open_bytes(file_path)
+    except OSError as e:
+        logger.warning("Error reading from file: %s", e)
+        return None
+
+
+def _read_raw(file_path: Union[str, Path]) -> Optional[bytes]:
+    """
+    Read a whole file as bytes with a single unbuffered read.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    Optional[bytes]: The content of the file, or None if an error occurred.
+    """
+    try:
+        with open(file_path, 'rb', buffering=0) as file:
+            return file.readall()
+    except OSError as e:
+        logger.warning("Error reading from file: %s", e)
         return None
 
 
+def read_many(file_paths: List[Union[str, Path]], max_inflight: int = 64) -> List[Optional[bytes]]:
+    """
+    Read several files concurrently and return their raw bytes.
+
+    Up to max_inflight reads run at once on worker threads, so their disk
+    latency overlaps instead of adding up.
+
+    Parameters:
+    file_paths (List[Union[str, Path]]): The paths to the files.
+    max_inflight (int): Maximum number of reads in progress at once (default is 64).
+
+    Returns:
+    List[Optional[bytes]]: The content of each file, in the order given, with None where an error occurred.
+    """
+    if not file_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_inflight, len(file_paths))) as pool:
+        return list(pool.map(_read_raw, file_paths))
+
+
+def read_from_file_async(file_path: Union[str, Path]) -> Future:
+    """
+    Queue a read of a file on the background I/O pool.
+
+    Many queued reads run concurrently, so their disk latency overlaps instead
+    of adding up as with repeated read_from_file calls. On Linux, a file that is
+    entirely in the page cache is read inline and the returned future is already
+    done, skipping the hop to a worker thread.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    Future: Resolves to the content of the file, or None if an error occurred.
+    """
+    content = _read_cached(file_path)
+    if content is None:
+        return _submit(read_from_file, file_path)
+    future = Future()
+    future.set_result(content)
+    return future
+
+
+def write_to_file_async(file_path: Union[str, Path], content: str) -> Future:
+    """
+    Queue a write of content to a file on the background I/O pool.
+
+    Writes to different files run concurrently. Writes to the same file are
+    not ordered relative to each other, so wait on the returned future (or call
+    flush()) before writing that file again or reading it back.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+    content (str): The content to write to the file.
+
+    Returns:
+    Future: Resolves to True if writing to the file was successful, False otherwise.
+    """
+    return _submit(write_to_file, file_path, content)
+
+
+def flush() -> None:
+    """
+    Block until every read and write queued so far has finished.
+    """
+    wait(list(_pending))
+
+
 def delete_file(file_path: Union[str, Path]) -> bool:
     """
     Delete a file at the specified path.
@@ -129,14 +771,70 @@ def delete_file(file_path: Union[str, Path]) -> bool:
     bool: True if the file was deleted successfully, False otherwise.
     """
     try:
+        _drop_append_handles(file_path)
         os.remove(file_path)
         return True
     except FileNotFoundError:
-        print(f"Error deleting file: {file_path} not found")
+        logger.warning("Error deleting file: %s not found", file_path)
         return False
-    except Exception as e:
-        print(f"Error deleting file: {e}")
+    except OSError as e:
+        logger.warning("Error deleting file: %s", e)
         return False
+    finally:
+        invalidate(file_path)
+
+
+def delete_files(file_paths: Iterable[Union[str, Path]]) -> List[bool]:
+    """
+    Delete several files, resolving each parent directory only once.
+
+    Files are grouped by directory. Each directory is opened once and every
+    file in it is unlinked relative to that handle, so the kernel does not
+    walk the full path again for each file.
+
+    Parameters:
+    file_paths (Iterable[Union[str, Path]]): The paths to the files.
+
+    Returns:
+    List[bool]: For each path in the order given, True if the file was deleted, False otherwise.
+    """
+    paths = [_s(file_path) for file_path in file_paths]
+    results = [False] * len(paths)
+    for path in paths:
+        _drop_append_handles(path)
+    by_directory: Dict[str, List[int]] = {}
+    for index, path in enumerate(paths):
+        by_directory.setdefault(os.path.dirname(path), []).append(index)
+    use_dir_fd = os.unlink in os.supports_dir_fd
+    for directory, indices in by_directory.items():
+        dir_fd = None
+        # A lone file gains nothing from the extra open/close of its directory
+        if use_dir_fd and len(indices) > 1:
+            try:
+                dir_fd = os.open(directory or '.', os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            except OSError:
+                # Each unlink below reports the problem for its own path
+                pass
+        try:
+            for index in indices:
+                path = paths[index]
+                try:
+                    if dir_fd is None:
+                        os.remove(path)
+                    else:
+                        os.unlink(os.path.basename(path), dir_fd=dir_fd)
+                    results[index] = True
+                except FileNotFoundError:
+                    logger.warning("Error deleting file: %s not found", path)
+                except OSError as e:
+                    # e.filename is only the base name when unlinking relative to dir_fd
+                    logger.warning("Error deleting file: %s: %s", path, e.strerror)
+                finally:
+                    invalidate(path)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    return results
 
 
 def list_directory_contents(directory_path: Union[str, Path]) -> Optional[List[str]]:
@@ -152,13 +850,55 @@ def list_directory_contents(directory_path: Union[str, Path]) -> Optional[List[s
     try:
         return os.listdir(directory_path)
     except FileNotFoundError:
-        print(f"Error listing directory contents: {directory_path} not found")
+        logger.warning("Error listing directory contents: %s not found", directory_path)
         return None
-    except Exception as e:
-        print(f"Error listing directory contents: {e}")
+    except OSError as e:
+        logger.warning("Error listing directory contents: %s", e)
         return None
 
 
+def list_directory_fast(
+    directory_path: Union[str, Path]
+) -> Optional[Tuple[List[str], List[bool], List[bool], List[int]]]:
+    """
+    List a directory together with each entry's type and size in one os.scandir pass.
+
+    The result is column-oriented: four parallel lists, one per attribute, so
+    callers can filter entries (e.g. sizes of regular files) without stat'ing
+    each name again. Symbolic links are reported as themselves, not followed.
+    Entries that vanish while being listed are skipped.
+
+    Parameters:
+    directory_path (Union[str, Path]): The path to the directory.
+
+    Returns:
+    Optional[Tuple[List[str], List[bool], List[bool], List[int]]]: The entry names,
+    is-directory flags, is-regular-file flags and sizes in bytes, or None if an error occurred.
+    """
+    names: List[str] = []
+    is_dir_flags: List[bool] = []
+    is_file_flags: List[bool] = []
+    sizes: List[int] = []
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                try:
+                    result = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                names.append(entry.name)
+                is_dir_flags.append(stat.S_ISDIR(result.st_mode))
+                is_file_flags.append(stat.S_ISREG(result.st_mode))
+                sizes.append(result.st_size)
+    except FileNotFoundError:
+        logger.warning("Error listing directory contents: %s not found", directory_path)
+        return None
+    except OSError as e:
+        logger.warning("Error listing directory contents: %s", e)
+        return None
+    return names, is_dir_flags, is_file_flags, sizes
+
+
 def move(src_path: Union[str, Path], dest_path: Union[str, Path]) -> bool:
     """
     Move a file or directory to a new location.
@@ -171,55 +911,74 @@ def move(src_path: Union[str, Path], dest_path: Union[str, Path]) -> bool:
     bool: True if the move was successful, False otherwise.
     """
     try:
+        _drop_append_handles(src_path)
+        _drop_append_handles(dest_path)
         shutil.move(src_path, dest_path)
         return True
     except FileNotFoundError:
-        print(f"Error moving: {src_path} not found")
+        logger.warning("Error moving: %s not found", src_path)
         return False
-    except Exception as e:
-        print(f"Error moving: {e}")
+    except OSError as e:
+        logger.warning("Error moving: %s", e)
         return False
+    finally:
+        clear_stat_cache()
 
 
-def copy(src_path: Union[str, Path], dest_path: Union[str, Path]) -> bool:
+def copy(src_path: Union[str, Path], dest_path: Union[str, Path], direct: bool = False) -> bool:
     """
     Copy a file or directory to a new location.
 
+    With direct=True, sources are read with O_DIRECT and each copy is flushed
+    and dropped from the page cache afterwards. Use this for backups and other
+    copies that will not be read back soon, so they do not evict useful cached
+    data. It falls back to a normal copy on filesystems without O_DIRECT.
+
     Parameters:
     src_path (Union[str, Path]): The source path.
     dest_path (Union[str, Path]): The destination path.
+    direct (bool): Bypass the page cache (default is False).
 
     Returns:
     bool: True if the copy was successful, False otherwise.
     """
     try:
-        if Path(src_path).is_dir():
-            shutil.copytree(src_path, dest_path)
-        else:
-            shutil.copy2(src_path, dest_path)
+        _drop_append_handles(dest_path)
+        try:
+            # Files are the common case; a directory source is detected when opening it fails
+            _copy_file(src_path, dest_path, direct)
+        except IsADirectoryError as e:
+            if e.filename != _s(src_path):
+                raise
+            _copytree_parallel(src_path, dest_path, direct=direct)
         return True
     except FileExistsError:
-        print(f"Error copying: {dest_path} already exists")
+        logger.warning("Error copying: %s already exists", dest_path)
         return False
     except FileNotFoundError:
-        print(f"Error copying: {src_path} not found")
+        logger.warning("Error copying: %s not found", src_path)
         return False
-    except Exception as e:
-        print(f"Error copying: {e}")
+    except OSError as e:
+        logger.warning("Error copying: %s", e)
         return False
+    finally:
+        clear_stat_cache()
 
 
 def directory_exists(directory_path: Union[str, Path]) -> bool:
     """
     Check if a directory exists at the specified path.
 
+    Repeated checks within STAT_CACHE_TTL seconds reuse one cached stat result.
+
     Parameters:
     directory_path (Union[str, Path]): The path to the directory.
 
     Returns:
     bool: True if the directory exists, False otherwise.
     """
-    return Path(directory_path).is_dir()
+    result = _cached_stat(directory_path)
+    return result is not None and stat.S_ISDIR(result.st_mode)
 
 
 def delete_directory(directory_path: Union[str, Path]) -> bool:
@@ -233,50 +992,158 @@ def delete_directory(directory_path: Union[str, Path]) -> bool:
     bool: True if the directory was deleted successfully, False otherwise.
     """
     try:
+        _drop_append_handles(directory_path)
         shutil.rmtree(directory_path)
         return True
     except FileNotFoundError:
-        print(f"Error deleting directory: {directory_path} not found")
+        logger.warning("Error deleting directory: %s not found", directory_path)
         return False
-    except Exception as e:
-        print(f"Error deleting directory: {e}")
+    except OSError as e:
+        logger.warning("Error deleting directory: %s", e)
         return False
+    finally:
+        clear_stat_cache()
 
 
-def append_to_file(file_path: Union[str, Path], content: str) -> bool:
+def append_to_file(file_path: Union[str, Path], content: str, buffered: bool = False) -> bool:
     """
     Append content to a file.
 
+    With buffered=True the file stays open between calls and small appends are
+    collected in an APPEND_BUFFER_SIZE buffer, so many appends cost one write
+    instead of an open, write and close each. Buffered content reaches the file
+    when the buffer fills, on flush_appends(), or at interpreter exit; until then
+    other readers (including read_from_file) do not see it.
+
     Parameters:
     file_path (Union[str, Path]): The path to the file.
     content (str): The content to append to the file.
+    buffered (bool): Keep the file open and buffer the write (default is False).
 
     Returns:
     bool: True if appending to the file was successful, False otherwise.
     """
     try:
-        with open(file_path, 'a', encoding='utf-8') as file:
-            file.write(content)
+        if buffered:
+            _append_handle(file_path).write(_encode_text(content))
+        else:
+            with open(file_path, 'a', encoding='utf-8') as file:
+                file.write(content)
         return True
-    except Exception as e:
-        print(f"Error appending to file: {e}")
+    except (OSError, ValueError) as e:
+        # ValueError: unencodable content, or a buffered handle closed by a concurrent flush_appends()
+        logger.warning("Error appending to file: %s", e)
         return False
+    finally:
+        invalidate(file_path)
+
+
+def _append_handle(file_path: Union[str, Path]) -> io.BufferedWriter:
+    """
+    Return the open append handle for a path, opening it on first use.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    io.BufferedWriter: The shared handle; BufferedWriter serialises writes from several threads.
+    """
+    key = _s(file_path)
+    handle = _append_handles.get(key)
+    if handle is None:
+        with _append_lock:
+            handle = _append_handles.get(key)
+            if handle is None:
+                handle = open(key, 'ab', buffering=APPEND_BUFFER_SIZE)
+                _append_handles[key] = handle
+    return handle
+
+
+def flush_appends(file_path: Optional[Union[str, Path]] = None) -> bool:
+    """
+    Write out and close the handles kept open by buffered appends.
+
+    Parameters:
+    file_path (Optional[Union[str, Path]]): Only flush this file's handle (default is every handle).
+
+    Returns:
+    bool: True if every flushed handle was written out successfully, False otherwise.
+    """
+    with _append_lock:
+        if file_path is None:
+            handles = list(_append_handles.values())
+            _append_handles.clear()
+        else:
+            handle = _append_handles.pop(_s(file_path), None)
+            handles = [] if handle is None else [handle]
+    return _close_append_handles(handles)
+
+
+def _drop_append_handles(path: Union[str, Path]) -> None:
+    """
+    Write out and close the buffered append handles for a path and for anything below it.
+
+    Called before a path is unlinked, renamed or truncated, so pending appends
+    reach the file they were made to, and later appends reopen the path instead
+    of writing to an unlinked or replaced file.
+
+    Parameters:
+    path (Union[str, Path]): The file or directory about to change.
+    """
+    if not _append_handles:
+        return
+    key = _s(path)
+    prefix = key.rstrip(os.sep) + os.sep
+    with _append_lock:
+        names = [name for name in _append_handles if name == key or name.startswith(prefix)]
+        handles = [_append_handles.pop(name) for name in names]
+    _close_append_handles(handles)
+
+
+def _close_append_handles(handles: List[io.BufferedWriter]) -> bool:
+    """
+    Close append handles taken out of _append_handles, writing out their buffers.
+
+    Parameters:
+    handles (List[io.BufferedWriter]): The handles to close.
+
+    Returns:
+    bool: True if every handle was written out successfully, False otherwise.
+    """
+    ok = True
+    for handle in handles:
+        try:
+            handle.close()
+        except OSError as e:
+            logger.warning("Error flushing appends: %s", e)
+            ok = False
+        finally:
+            invalidate(handle.name)
+    return ok
+
+
+atexit.register(flush_appends)
 
 
 def get_file_size(file_path: Union[str, Path]) -> Optional[int]:
     """
     Get the size of a file in bytes.
 
+    Repeated lookups within STAT_CACHE_TTL seconds reuse one cached stat result.
+
     Parameters:
     file_path (Union[str, Path]): The path to the file.
 
     Returns:
     Optional[int]: The size of the file in bytes, or None if an error occurred.
     """
+    result = _cached_stat(file_path)
+    if result is not None:
+        return result.st_size
     try:
         return os.path.getsize(file_path)
-    except Exception as e:
-        print(f"Error getting file size: {e}")
+    except OSError as e:
+        logger.warning("Error getting file size: %s", e)
         return None
 
 
@@ -292,7 +1159,7 @@ def is_symlink(file_path: Union[str, Path]) -> bool:
     Returns:
     bool: True if the path is a symbolic link, False otherwise.
     """
-    return Path(file_path).is_symlink()
+    return os.path.islink(file_path)
 
 
 def create_symlink(src_path: Union[str, Path], dest_path: Union[str, Path]) -> bool:
@@ -307,11 +1174,13 @@ def create_symlink(src_path: Union[str, Path], dest_path: Union[str, Path]) -> b
     bool: True if the symlink was created successfully, False otherwise.
     """
     try:
-        Path(dest_path).symlink_to(src_path)
+        os.symlink(src_path, dest_path)
         return True
-    except Exception as e:
-        print(f"Error creating symlink: {e}")
+    except OSError as e:
+        logger.warning("Error creating symlink: %s", e)
         return False
+    finally:
+        invalidate(dest_path)
 
 
 def read_lines_from_file(file_path: Union[str, Path]) -> Optional[List[str]]:
@@ -327,8 +1196,8 @@ def read_lines_from_file(file_path: Union[str, Path]) -> Optional[List[str]]:
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             return file.readlines()
-    except Exception as e:
-        print(f"Error reading lines from file: {e}")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning("Error reading lines from file: %s", e)
         return None
 
 
@@ -343,12 +1212,129 @@ def count_files_in_directory(directory_path: Union[str, Path]) -> Optional[int]:
     Optional[int]: The number of files in the directory, or None if an error occurred.
     """
     try:
-        return len([entry for entry in Path(directory_path).iterdir() if entry.is_file()])
-    except Exception as e:
-        print(f"Error counting files in directory: {e}")
+        with os.scandir(directory_path) as entries:
+            return sum(1 for entry in entries if entry.is_file())
+    except OSError as e:
+        logger.warning("Error counting files in directory: %s", e)
         return None
 
 
+# Asynchronous wrappers: the blocking call runs on asyncio's default executor
+
+async def aread_from_file(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Read content from a file without blocking the event loop.
+
+    A file that is entirely in the page cache is read inline (see
+    read_from_file_async); otherwise the read runs in a worker thread.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    Optional[str]: The content of the file, or None if an error occurred.
+    """
+    content = _read_cached(file_path)
+    if content is not None:
+        return content
+    return await asyncio.to_thread(read_from_file, file_path)
+
+
+async def aread_many(file_paths: List[Union[str, Path]]) -> List[Optional[str]]:
+    """
+    Read several files concurrently without blocking the event loop.
+
+    Parameters:
+    file_paths (List[Union[str, Path]]): The paths to the files.
+
+    Returns:
+    List[Optional[str]]: The content of each file, in the order given, with None where an error occurred.
+    """
+    return list(await asyncio.gather(*(aread_from_file(file_path) for file_path in file_paths)))
+
+
+async def awrite_to_file(file_path: Union[str, Path], content: str) -> bool:
+    """
+    Write content to a file without blocking the event loop.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+    content (str): The content to write to the file.
+
+    Returns:
+    bool: True if writing to the file was successful, False otherwise.
+    """
+    return await asyncio.to_thread(write_to_file, file_path, content)
+
+
+async def aappend_to_file(file_path: Union[str, Path], content: str) -> bool:
+    """
+    Append content to a file without blocking the event loop.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+    content (str): The content to append to the file.
+
+    Returns:
+    bool: True if appending to the file was successful, False otherwise.
+    """
+    return await asyncio.to_thread(append_to_file, file_path, content)
+
+
+async def adelete_file(file_path: Union[str, Path]) -> bool:
+    """
+    Delete a file without blocking the event loop.
+
+    Parameters:
+    file_path (Union[str, Path]): The path to the file.
+
+    Returns:
+    bool: True if the file was deleted successfully, False otherwise.
+    """
+    return await asyncio.to_thread(delete_file, file_path)
+
+
+async def alist_directory_contents(directory_path: Union[str, Path]) -> Optional[List[str]]:
+    """
+    List the contents of a directory without blocking the event loop.
+
+    Parameters:
+    directory_path (Union[str, Path]): The path to the directory.
+
+    Returns:
+    Optional[List[str]]: A list of the names of the entries in the directory, or None if an error occurred.
+    """
+    return await asyncio.to_thread(list_directory_contents, directory_path)
+
+
+async def amove(src_path: Union[str, Path], dest_path: Union[str, Path]) -> bool:
+    """
+    Move a file or directory to a new location without blocking the event loop.
+
+    Parameters:
+    src_path (Union[str, Path]): The source path.
+    dest_path (Union[str, Path]): The destination path.
+
+    Returns:
+    bool: True if the move was successful, False otherwise.
+    """
+    return await asyncio.to_thread(move, src_path, dest_path)
+
+
+async def acopy(src_path: Union[str, Path], dest_path: Union[str, Path]) -> bool:
+    """
+    Copy a file or directory to a new location without blocking the event loop.
+
+    Parameters:
+    src_path (Union[str, Path]): The source path.
+    dest_path (Union[str, Path]): The destination path.
+
+    Returns:
+    bool: True if the copy was successful, False otherwise.
+    """
+    return await asyncio.to_thread(copy, src_path, dest_path)
+
+
 if __name__ == "__main__":
     import file_system_manager as fsm
 
@@ -1,6 +1,310 @@
+import locale
+import logging
+import mmap
 import os
 import shutil
-from typing import List, Optional
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from logging_debugging_utilities import Logger
+
+# Error channel for FileSystemTool; messages below WARNING are dropped without formatting
+_log = Logger(__name__, log_level=logging.WARNING)
+
+# Largest chunk handed to os.copy_file_range per call
+_COPY_CHUNK = 1 << 30
+
+# Files at least this large are decoded straight from a memory map in read_file
+MMAP_THRESHOLD = 1 << 20
+
+# Size classes of the per-thread read buffers; files up to MMAP_THRESHOLD are read into one
+_BUFFER_SIZES = (1 << 12, 1 << 16, MMAP_THRESHOLD)
+_buffers = threading.local()
+
+# Read size used when fstat reports no size (e.g. procfs files)
+_READ_CHUNK = 1 << 16
+
+# Extra os.open flags for read_file and write_file. Each is 0 where the platform lacks it: O_CLOEXEC is
+# POSIX-only, and O_BINARY (Windows) keeps the CRLF translation done by _encode_text from being applied twice
+_OPEN_FLAGS = getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+# get_directory_size walks subtrees in parallel when a directory has more subdirectories than this
+_PARALLEL_MIN_SUBDIRS = 4
+# At most this many metadata requests are kept in flight against one tree; more overloads NFS/SMB servers
+_MAX_SIZE_WORKERS = 16
+
+# Opt-in stat cache used by the size queries; see FileSystemTool.enable_stat_cache
+_stat_cache: Dict[str, os.stat_result] = {}
+_stat_cache_lock = threading.Lock()
+_stat_cache_enabled = False
+
+def _stat_cached(path: str, stat_fn: Optional[Callable[[], os.stat_result]] = None) -> os.stat_result:
+    """
+    Stat a path (symlinks followed), answering from the stat cache when it is enabled.
+
+    :param path: The path to stat.
+    :param stat_fn: Callable producing the stat result on a miss (e.g. DirEntry.stat); defaults to os.stat.
+    :return: The stat result.
+    :raises OSError: If the path cannot be stat'ed.
+    """
+    if not _stat_cache_enabled:
+        return stat_fn() if stat_fn is not None else os.stat(path)
+    key = os.path.abspath(path)
+    result = _stat_cache.get(key)
+    if result is None:
+        result = stat_fn() if stat_fn is not None else os.stat(path)
+        with _stat_cache_lock:
+            _stat_cache[key] = result
+    return result
+
+def _invalidate(*paths: str) -> None:
+    """
+    Drop cached stat results for the given paths and everything below them.
+
+    :param paths: Paths whose cached entries are stale.
+    """
+    if not _stat_cache:
+        return
+    with _stat_cache_lock:
+        for path in paths:
+            key = os.path.abspath(path)
+            prefix = key.rstrip(os.sep) + os.sep
+            for cached in [k for k in _stat_cache if k == key or k.startswith(prefix)]:
+                del _stat_cache[cached]
+
+def _file_stat(path: str, cached: bool = False) -> Optional[os.stat_result]:
+    """
+    Stat a path once, answering both "is it a regular file?" and the metadata query.
+
+    :param path: The path to check.
+    :param cached: Whether the answer may come from the stat cache.
+    :return: The stat result if the path is a regular file (symlinks followed), None otherwise.
+    """
+    try:
+        result = _stat_cached(path) if cached else os.stat(path)
+    except (OSError, ValueError):
+        # os.path.isfile treats every stat failure as "not a file"
+        return None
+    return result if stat.S_ISREG(result.st_mode) else None
+
+def _read_all(fd: int, size: int) -> bytes:
+    """
+    Read a whole file with a single os.pread sized by fstat.
+
+    Files that report a size of 0 (procfs, sysfs) or come back short (the
+    kernel caps one read near 2 GiB) are read on in chunks until EOF.
+
+    :param fd: A file descriptor opened for reading.
+    :param size: The file size reported by fstat.
+    :return: The file's bytes.
+    :raises OSError: If the descriptor cannot be read.
+    """
+    data = os.pread(fd, size, 0) if size else b''
+    if size and len(data) == size:
+        return data
+    chunks = [data]
+    offset = len(data)
+    while True:
+        chunk = os.pread(fd, _READ_CHUNK, offset)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+def _read_buffer(size: int) -> bytearray:
+    """
+    Return this thread's reusable read buffer of the smallest size class holding size bytes.
+
+    :param size: Number of bytes the buffer must hold; at most MMAP_THRESHOLD.
+    :return: A bytearray reused by later reads on the same thread.
+    """
+    pool = getattr(_buffers, 'pool', None)
+    if pool is None:
+        pool = _buffers.pool = {}
+    capacity = next(c for c in _BUFFER_SIZES if c >= size)
+    buf = pool.get(capacity)
+    if buf is None:
+        buf = pool[capacity] = bytearray(capacity)
+    return buf
+
+def _decode_text(data) -> str:
+    """
+    Decode file bytes the way text-mode open() would, including universal newlines.
+
+    :param data: The raw file contents.
+    :return: The decoded text.
+    """
+    content = str(data, locale.getpreferredencoding(False))
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def _read_text(fd: int) -> str:
+    """
+    Read and decode a whole file, memory-mapping it when it is at least MMAP_THRESHOLD bytes.
+
+    A mapped file is decoded straight from the page cache, without first
+    copying it into a bytes object. On Linux the mapping is prefaulted with
+    MAP_POPULATE and the kernel is told the access is sequential. Smaller
+    files are read into a reused per-thread buffer; files that cannot be
+    mapped, or report no size, fall back to os.pread.
+
+    :param fd: A file descriptor opened for reading.
+    :return: The decoded text.
+    :raises OSError: If the descriptor cannot be read.
+    """
+    size = os.fstat(fd).st_size
+    if size >= MMAP_THRESHOLD:
+        try:
+            mapped = mmap.mmap(fd, size, flags=mmap.MAP_SHARED | getattr(mmap, 'MAP_POPULATE', 0), prot=mmap.PROT_READ)
+        except OSError:
+            # e.g. ENODEV on filesystems without mmap support
+            pass
+        else:
+            with mapped:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+                return _decode_text(mapped)
+    if 0 < size <= MMAP_THRESHOLD and hasattr(os, 'readv'):
+        # Fill a pooled buffer in place instead of allocating a bytes object per read
+        with memoryview(_read_buffer(size)) as view:
+            count = os.readv(fd, [view[:size]])
+            return _decode_text(view[:count])
+    return _decode_text(_read_all(fd, size))
+
+def _encode_text(content: str) -> bytes:
+    """
+    Encode text the way text-mode open() would, translating newlines to os.linesep.
+
+    :param content: The text to encode.
+    :return: The encoded bytes.
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode(locale.getpreferredencoding(False))
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write every byte of data to a file descriptor; os.write may write only part of it.
+
+    :param fd: A file descriptor opened for writing.
+    :param data: The bytes to write.
+    :raises OSError: If the write fails.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _copy(src: str, dest: str) -> None:
+    """
+    Copy a file's data and permission bits like shutil.copy, keeping the data in the kernel.
+
+    The data is moved with os.copy_file_range (Linux; a reflink on
+    copy-on-write filesystems). It falls back to a chunked shutil.copyfileobj
+    when the call is unavailable or unsupported.
+
+    :param src: The source path of the file.
+    :param dest: The destination file path, or a directory to copy into.
+    :raises shutil.SameFileError: If the destination is the source file itself.
+    :raises OSError: If either file cannot be opened or copied.
+    """
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(src))
+    with open(src, 'rb', buffering=0) as fsrc:
+        try:
+            if os.path.samestat(os.fstat(fsrc.fileno()), os.stat(dest)):
+                raise shutil.SameFileError(f"{src!r} and {dest!r} are the same file")
+        except FileNotFoundError:
+            pass
+        with open(dest, 'wb', buffering=0) as fdst:
+            copy_file_range = getattr(os, 'copy_file_range', None)
+            copied = False
+            if copy_file_range is not None:
+                try:
+                    while copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK):
+                        pass
+                    copied = True
+                except OSError:
+                    # EXDEV/ENOSYS/EINVAL; both offsets advanced together, so the fallback resumes
+                    pass
+            if not copied:
+                shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copymode(src, dest)
+
+def _scan_sizes(path: str, subdirs: List[str]) -> int:
+    """
+    Sum the sizes of the files directly inside one directory.
+
+    File symlinks are measured at their target; subdirectories (but not
+    directory symlinks) are appended to subdirs for the caller to descend
+    into. An unreadable directory counts as empty.
+
+    :param path: The path of the directory.
+    :param subdirs: List that receives the subdirectory paths.
+    :return: Total size of the directory's own files in bytes.
+    :raises OSError: If a file's size cannot be read.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return 0
+    total_size = 0
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                total_size += _stat_cached(entry.path, entry.stat).st_size
+    return total_size
+
+def _tree_size(path: str) -> int:
+    """
+    Sum the sizes of the files under a directory with an explicit os.scandir stack.
+
+    Matches the previous os.walk loop: file symlinks are measured at their
+    target, directory symlinks are neither followed nor counted, and
+    unreadable subdirectories are skipped.
+
+    :param path: The path of the directory.
+    :return: Total size of the files in bytes.
+    :raises OSError: If a file's size cannot be read.
+    """
+    total_size = 0
+    pending = [path]
+    while pending:
+        total_size += _scan_sizes(pending.pop(), pending)
+    return total_size
+
+def _tree_size_parallel(path: str) -> int:
+    """
+    Sum the sizes of the files under a directory, one worker thread per top-level subdirectory.
+
+    os.scandir and stat release the GIL, so the subtrees are walked
+    concurrently. Directories with few subdirectories are walked sequentially
+    to avoid the pool overhead.
+
+    :param path: The path of the directory.
+    :return: Total size of the files in bytes.
+    :raises OSError: If a file's size cannot be read.
+    """
+    subdirs: List[str] = []
+    total_size = _scan_sizes(path, subdirs)
+    if len(subdirs) <= _PARALLEL_MIN_SUBDIRS:
+        return total_size + sum(_tree_size(subdir) for subdir in subdirs)
+    workers = min(_MAX_SIZE_WORKERS, (os.cpu_count() or 1) * 4, len(subdirs))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(_tree_size, subdir) for subdir in subdirs]
+        return total_size + sum(future.result() for future in as_completed(futures))
+    finally:
+        pool.shutdown(cancel_futures=True)
 
 class FileSystemTool:
     """
@@ -16,12 +320,12 @@ class FileSystemTool:
         :return: List of directory contents or None if an error occurs.
         """
         if not os.path.isdir(path):
-            print(f"Error: {path} is not a valid directory.")
+            _log.warning("Error: %s is not a valid directory.", path)
             return None
         try:
             return os.listdir(path)
         except OSError as e:
-            print(f"Error listing directory contents: {e}")
+            _log.warning("Error listing directory contents: %s", e)
             return None
 
     @staticmethod
@@ -35,9 +339,11 @@ class FileSystemTool:
             with open(path, 'x'):
                 pass
         except FileExistsError:
-            print(f"Error: File {path} already exists.")
+            _log.warning("Error: File %s already exists.", path)
         except OSError as e:
-            print(f"Error creating file: {e}")
+            _log.warning("Error creating file: %s", e)
+        finally:
+            _invalidate(path)
 
     @staticmethod
     def create_directory(path: str) -> None:
@@ -49,7 +355,9 @@ class FileSystemTool:
         try:
             os.makedirs(path, exist_ok=True)
         except OSError as e:
-            print(f"Error creating directory: {e}")
+            _log.warning("Error creating directory: %s", e)
+        finally:
+            _invalidate(path)
 
     @staticmethod
     def delete_file(path: str) -> None:
@@ -58,13 +366,14 @@ class FileSystemTool:
 
         :param path: The path of the file to be deleted.
         """
-        if not os.path.isfile(path):
-            print(f"Error: {path} is not a valid file.")
-            return
         try:
             os.remove(path)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            _log.warning("Error: %s is not a valid file.", path)
         except OSError as e:
-            print(f"Error deleting file: {e}")
+            _log.warning("Error deleting file: %s", e)
+        finally:
+            _invalidate(path)
 
     @staticmethod
     def delete_directory(path: str) -> None:
@@ -73,31 +382,44 @@ class FileSystemTool:
 
         :param path: The path of the directory to be deleted.
         """
-        if not os.path.isdir(path):
-            print(f"Error: {path} is not a valid directory.")
-            return
         try:
             shutil.rmtree(path)
+        except (FileNotFoundError, NotADirectoryError):
+            _log.warning("Error: %s is not a valid directory.", path)
         except OSError as e:
-            print(f"Error deleting directory: {e}")
+            _log.warning("Error deleting directory: %s", e)
+        finally:
+            _invalidate(path)
 
     @staticmethod
-    def read_file(path: str) -> Optional[str]:
+    def read_file(path: str, drop_cache: bool = False) -> Optional[str]:
         """
         Read the contents of the file at the specified path.
 
         :param path: The path of the file to be read.
+        :param drop_cache: Whether to ask the kernel to evict the file from the page cache
+            once it has been read. Use this for one-pass bulk reads, so that they do not push
+            hotter data out of the cache.
         :return: Contents of the file or None if an error occurs.
         """
-        if not os.path.isfile(path):
-            print(f"Error: {path} is not a valid file.")
-            return None
         try:
-            with open(path, 'r') as file:
-                return file.read()
+            fd = os.open(path, os.O_RDONLY | _OPEN_FLAGS)
+            try:
+                fadvise = drop_cache and getattr(os, 'posix_fadvise', None)
+                if fadvise:
+                    fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                content = _read_text(fd)
+                if fadvise:
+                    fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            _log.warning("Error: %s is not a valid file.", path)
+            return None
         except OSError as e:
-            print(f"Error reading file: {e}")
+            _log.warning("Error reading file: %s", e)
             return None
+        return content
 
     @staticmethod
     def write_file(path: str, content: str) -> None:
@@ -107,11 +429,69 @@ class FileSystemTool:
         :param path: The path of the file to write to.
         :param content: The content to write to the file.
         """
+        data = _encode_text(content)
         try:
-            with open(path, 'w') as file:
-                file.write(content)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _OPEN_FLAGS, 0o666)
+            try:
+                _write_all(fd, data)
+            finally:
+                os.close(fd)
         except OSError as e:
-            print(f"Error writing to file: {e}")
+            _log.warning("Error writing to file: %s", e)
+        finally:
+            _invalidate(path)
+
+    @staticmethod
+    def write_files_batch(items: Iterable[Tuple[str, Union[str, bytes]]]) -> List[bool]:
+        """
+        Write several files in one call, creating or truncating each of them.
+
+        Files are grouped by parent directory. Each directory is opened once and
+        its files are opened relative to that descriptor, so the path is not
+        resolved again for every file; a directory holding a single file, or
+        any directory on platforms without dir_fd support for os.open, is
+        skipped straight to one open by path. Bytes are written as-is; str
+        content is encoded like write_file does.
+
+        :param items: (path, content) pairs to write.
+        :return: One flag per item, True if that file was written.
+        """
+        items = list(items)
+        results = [False] * len(items)
+        groups: Dict[str, List[int]] = {}
+        for index, (path, _) in enumerate(items):
+            groups.setdefault(os.path.dirname(path) or os.curdir, []).append(index)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _OPEN_FLAGS
+        use_dir_fd = os.open in os.supports_dir_fd
+        for directory, indices in groups.items():
+            dir_fd = None
+            if use_dir_fd and len(indices) > 1:
+                try:
+                    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_CLOEXEC', 0))
+                except OSError as e:
+                    for index in indices:
+                        _log.warning("Error writing to file: %s: %s", items[index][0], e.strerror)
+                    continue
+            try:
+                for index in indices:
+                    path, content = items[index]
+                    data = content if isinstance(content, bytes) else _encode_text(content)
+                    try:
+                        name = path if dir_fd is None else os.path.basename(path)
+                        fd = os.open(name, flags, 0o666, dir_fd=dir_fd)
+                        try:
+                            _write_all(fd, data)
+                        finally:
+                            os.close(fd)
+                        results[index] = True
+                    except OSError as e:
+                        _log.warning("Error writing to file: %s: %s", path, e.strerror)
+                    finally:
+                        _invalidate(path)
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+        return results
 
     @staticmethod
     def append_to_file(path: str, content: str) -> None:
@@ -125,7 +505,9 @@ class FileSystemTool:
             with open(path, 'a') as file:
                 file.write(content)
         except OSError as e:
-            print(f"Error appending to file: {e}")
+            _log.warning("Error appending to file: %s", e)
+        finally:
+            _invalidate(path)
 
     @staticmethod
     def move_file(src: str, dest: str) -> None:
@@ -136,12 +518,14 @@ class FileSystemTool:
         :param dest: The destination path of the file.
         """
         if not os.path.isfile(src):
-            print(f"Error: {src} is not a valid file.")
+            _log.warning("Error: %s is not a valid file.", src)
             return
         try:
             shutil.move(src, dest)
         except OSError as e:
-            print(f"Error moving file: {e}")
+            _log.warning("Error moving file: %s", e)
+        finally:
+            _invalidate(src, dest)
 
     @staticmethod
     def copy_file(src: str, dest: str) -> None:
@@ -151,13 +535,18 @@ class FileSystemTool:
         :param src: The source path of the file.
         :param dest: The destination path of the file.
         """
-        if not os.path.isfile(src):
-            print(f"Error: {src} is not a valid file.")
-            return
         try:
-            shutil.copy(src, dest)
+            _copy(src, dest)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            # The same errors can come from the destination side
+            if e.filename != src:
+                _log.warning("Error copying file: %s", e)
+            else:
+                _log.warning("Error: %s is not a valid file.", src)
         except OSError as e:
-            print(f"Error copying file: {e}")
+            _log.warning("Error copying file: %s", e)
+        finally:
+            _invalidate(dest)
 
     @staticmethod
     def check_path_exists(path: str) -> bool:
@@ -177,14 +566,11 @@ class FileSystemTool:
         :param path: The path of the file.
         :return: Size of the file in bytes or None if an error occurs.
         """
-        if not os.path.isfile(path):
-            print(f"Error: {path} is not a valid file.")
-            return None
-        try:
-            return os.path.getsize(path)
-        except OSError as e:
-            print(f"Error getting file size: {e}")
+        result = _file_stat(path, cached=True)
+        if result is None:
+            _log.warning("Error: %s is not a valid file.", path)
             return None
+        return result.st_size
 
     @staticmethod
     def get_directory_size(path: str) -> Optional[int]:
@@ -195,17 +581,12 @@ class FileSystemTool:
         :return: Size of the directory in bytes or None if an error occurs.
         """
         if not os.path.isdir(path):
-            print(f"Error: {path} is not a valid directory.")
+            _log.warning("Error: %s is not a valid directory.", path)
             return None
-        total_size = 0
         try:
-            for dirpath, _, filenames in os.walk(path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    total_size += os.path.getsize(fp)
-            return total_size
+            return _tree_size_parallel(path)
         except OSError as e:
-            print(f"Error getting directory size: {e}")
+            _log.warning("Error getting directory size: %s", e)
             return None
 
     @staticmethod
@@ -216,14 +597,11 @@ class FileSystemTool:
         :param path: The path of the file.
         :return: Last modification time in seconds since the epoch, or None if an error occurs.
         """
-        if not os.path.isfile(path):
-            print(f"Error: {path} is not a valid file.")
-            return None
-        try:
-            return os.path.getmtime(path)
-        except OSError as e:
-            print(f"Error getting file modification time: {e}")
+        result = _file_stat(path)
+        if result is None:
+            _log.warning("Error: %s is not a valid file.", path)
             return None
+        return result.st_mtime
 
     @staticmethod
     def get_file_creation_time(path: str) -> Optional[float]:
@@ -233,14 +611,35 @@ class FileSystemTool:
         :param path: The path of the file.
         :return: Creation time in seconds since the epoch, or None if an error occurs.
         """
-        if not os.path.isfile(path):
-            print(f"Error: {path} is not a valid file.")
-            return None
-        try:
-            return os.path.getctime(path)
-        except OSError as e:
-            print(f"Error getting file creation time: {e}")
+        result = _file_stat(path)
+        if result is None:
+            _log.warning("Error: %s is not a valid file.", path)
             return None
+        return result.st_ctime
+
+    @staticmethod
+    def enable_stat_cache(enabled: bool = True) -> None:
+        """
+        Turn the stat cache used by get_file_size and get_directory_size on or off.
+
+        While enabled, a path stat'ed by either query is answered from memory
+        until a FileSystemTool method changes it. Changes made by other code
+        are not seen; call clear_stat_cache() when that matters.
+
+        :param enabled: Whether size queries may be answered from the cache.
+        """
+        global _stat_cache_enabled
+        _stat_cache_enabled = enabled
+        if not enabled:
+            FileSystemTool.clear_stat_cache()
+
+    @staticmethod
+    def clear_stat_cache() -> None:
+        """
+        Drop every cached stat result.
+        """
+        with _stat_cache_lock:
+            _stat_cache.clear()
 
 if __name__ == "__main__":
     fs_tool = FileSystemTool()
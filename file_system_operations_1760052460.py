@@ -1,7 +1,13 @@
+import logging
 import os
 import shutil
 from pathlib import Path
 
+from logging_debugging_utilities import Logger
+
+# Errors are logged as warnings; success messages are debug and dropped unless enabled
+_log = Logger(__name__, log_level=logging.WARNING)
+
 class FileSystemUtility:
     """
     A utility class for file system operations.
@@ -16,11 +22,11 @@ class FileSystemUtility:
         """
         try:
             Path(path).mkdir(parents=True, exist_ok=True)
-            print(f"Directory created at: {path}")
+            _log.debug("Directory created at: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot create directory at {path}")
+            _log.warning("Permission denied: Cannot create directory at %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
 
     @staticmethod
     def list_files(path):
@@ -31,13 +37,15 @@ class FileSystemUtility:
         :return: A list of filenames.
         """
         try:
-            return [f for f in os.listdir(path) if Path(path, f).is_file()]
+            with os.scandir(path) as entries:
+                # DirEntry answers from the directory listing, with no stat per entry
+                return [entry.name for entry in entries if entry.is_file()]
         except FileNotFoundError:
-            print(f"Directory not found: {path}")
+            _log.warning("Directory not found: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot list files in {path}")
+            _log.warning("Permission denied: Cannot list files in %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
         return []
 
     @staticmethod
@@ -50,13 +58,13 @@ class FileSystemUtility:
         """
         try:
             shutil.copy2(source, destination)
-            print(f"File copied from {source} to {destination}")
+            _log.debug("File copied from %s to %s", source, destination)
         except FileNotFoundError:
-            print(f"Source file not found: {source}")
+            _log.warning("Source file not found: %s", source)
         except PermissionError:
-            print(f"Permission denied: Cannot copy file to {destination}")
+            _log.warning("Permission denied: Cannot copy file to %s", destination)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
 
     @staticmethod
     def move_file(source, destination):
@@ -68,13 +76,13 @@ class FileSystemUtility:
         """
         try:
             shutil.move(source, destination)
-            print(f"File moved from {source} to {destination}")
+            _log.debug("File moved from %s to %s", source, destination)
         except FileNotFoundError:
-            print(f"Source file not found: {source}")
+            _log.warning("Source file not found: %s", source)
         except PermissionError:
-            print(f"Permission denied: Cannot move file to {destination}")
+            _log.warning("Permission denied: Cannot move file to %s", destination)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
 
     @staticmethod
     def delete_file(path):
@@ -85,13 +93,13 @@ class FileSystemUtility:
         """
         try:
             os.remove(path)
-            print(f"File deleted: {path}")
+            _log.debug("File deleted: %s", path)
         except FileNotFoundError:
-            print(f"File not found: {path}")
+            _log.warning("File not found: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot delete file: {path}")
+            _log.warning("Permission denied: Cannot delete file: %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
 
     @staticmethod
     def get_file_size(path):
@@ -104,11 +112,11 @@ class FileSystemUtility:
         try:
             return os.path.getsize(path)
         except FileNotFoundError:
-            print(f"File not found: {path}")
+            _log.warning("File not found: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot get size of file: {path}")
+            _log.warning("Permission denied: Cannot get size of file: %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
         return 0
 
     @staticmethod
@@ -122,11 +130,11 @@ class FileSystemUtility:
         try:
             with open(path, 'w', encoding='utf-8') as file:
                 file.write(content)
-            print(f"File created at: {path}")
+            _log.debug("File created at: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot create file at {path}")
+            _log.warning("Permission denied: Cannot create file at %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
 
     @staticmethod
     def read_file(path):
@@ -140,11 +148,11 @@ class FileSystemUtility:
             with open(path, 'r', encoding='utf-8') as file:
                 return file.read()
         except FileNotFoundError:
-            print(f"File not found: {path}")
+            _log.warning("File not found: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot read file: {path}")
+            _log.warning("Permission denied: Cannot read file: %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
         return ""
 
     @staticmethod
@@ -156,13 +164,14 @@ class FileSystemUtility:
         :return: A list of directory names.
         """
         try:
-            return [d for d in os.listdir(path) if Path(path, d).is_dir()]
+            with os.scandir(path) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
         except FileNotFoundError:
-            print(f"Directory not found: {path}")
+            _log.warning("Directory not found: %s", path)
         except PermissionError:
-            print(f"Permission denied: Cannot list directories in {path}")
+            _log.warning("Permission denied: Cannot list directories in %s", path)
         except OSError as e:
-            print(f"OS error: {e}")
+            _log.warning("OS error: %s", e)
         return []
 
 if __name__ == "__main__":
@@ -1,7 +1,87 @@
+import atexit
+import copy
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+import time
 import traceback
 
+# Level name -> level of the per-instance fast paths bound by Logger.rebind_fastpaths
+_FAST_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+def _discard(msg: str, *args):
+    """Stands in for a logging method whose level is disabled."""
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+class _FastFormatter(logging.Formatter):
+    """
+    Produces the same output as ``logging.Formatter(_LOG_FORMAT)`` with less work per record.
+
+    The timestamp is rendered by strftime once per second and reused for later
+    records in the same second, and the " - name - level - " part is built once
+    per (name, level) pair.
+    """
+
+    def __init__(self):
+        super().__init__(_LOG_FORMAT)
+        # (whole second, rendered timestamp), replaced as one tuple so threads never see a torn pair
+        self._stamp = (None, '')
+        self._prefixes = {}
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, stamp = self._stamp
+        if second != cached_second:
+            stamp = time.strftime(self.default_time_format, self.converter(record.created))
+            self._stamp = (second, stamp)
+        return self.default_msec_format % (stamp, record.msecs)
+
+    def format(self, record):
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record)
+        key = (record.name, record.levelname)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = self._prefixes[key] = f" - {record.name} - {record.levelname} - "
+        s = record.asctime + prefix + record.message
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    A QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() runs the handler's formatter on the calling thread,
+    rendering the traceback of every exception record there. This one only
+    merges the message arguments, so later changes to mutable arguments
+    cannot alter the message, and queues a copy that still carries exc_info
+    and stack_info for the listener's formatter.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        return record
+
 class Logger:
     """
     A class to encapsulate the logging setup and provide utilities for logging
@@ -9,9 +89,10 @@ class Logger:
 
     Attributes:
         logger (logging.Logger): The root logger instance.
+        listener (logging.handlers.QueueListener): The background thread writing records, or None unless queued.
     """
 
-    def __init__(self, name: str, log_file: str = None, log_level: int = logging.DEBUG, max_bytes: int = 10485760, backup_count: int = 5):
+    def __init__(self, name: str, log_file: str = None, log_level: int = logging.DEBUG, max_bytes: int = 10485760, backup_count: int = 5, queued: bool = False):
         """
         Initializes the Logger instance.
 
@@ -21,64 +102,113 @@ class Logger:
             log_level (int, optional): The logging level. Defaults to logging.DEBUG.
             max_bytes (int, optional): Maximum size in bytes of the log file before it gets rotated. Defaults to 10485760 (10MB).
             backup_count (int, optional): Number of backup files to keep. Defaults to 5.
+            queued (bool, optional): Hand records to a background thread that formats and writes them.
+                Callers only merge the message arguments and put the record on a queue; timestamps and
+                tracebacks are rendered on that thread. Records still queued are written at interpreter exit.
+                Defaults to False.
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(log_level)
         self.logger.propagate = False  # Prevent logging from propagating to the root logger
 
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        formatter = _FastFormatter()
 
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # File handler
         if log_file:
             file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        self.listener = None
+        if queued:
+            log_queue = queue.SimpleQueue()
+            self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self.logger.addHandler(_DeferredQueueHandler(log_queue))
+            self.listener.start()
+            atexit.register(self.close)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        self.rebind_fastpaths()
+
+    def close(self):
+        """
+        Stops the background thread of a queued logger after it has written the records still queued.
 
-    def _log(self, level: int, msg: str):
+        Called at interpreter exit; safe to call again, after stopping
+        ``self.listener`` by hand, or on a logger that is not queued.
+        """
+        atexit.unregister(self.close)
+        # QueueListener.stop() fails if the listener has already been stopped
+        if self.listener is not None and self.listener._thread is not None:
+            self.listener.stop()
+
+    def rebind_fastpaths(self):
+        """
+        Binds debug/info/warning/error/critical for the logger's current level.
+
+        Disabled levels become a no-op and enabled ones call the underlying
+        logging.Logger method directly, so a filtered-out call costs a single
+        function call. Call this again after changing the level of
+        ``self.logger`` (or calling logging.disable) at runtime.
+        """
+        for name, level in _FAST_LEVELS.items():
+            setattr(self, name, getattr(self.logger, name) if self.logger.isEnabledFor(level) else _discard)
+
+    def _log(self, level: int, msg: str, *args):
         """
         Logs a message with the given level.
 
         Args:
             level (int): The logging level.
-            msg (str): The message to log.
+            msg (str): The message to log, with %-style placeholders for ``args``.
+            *args: Values merged into ``msg`` only if the message is emitted.
         """
         if self.logger.isEnabledFor(level):
-            self.logger.log(level, msg)
+            self.logger.log(level, msg, *args)
 
-    def debug(self, msg: str):
+    def debug(self, msg: str, *args):
         """Logs a debug message."""
-        self._log(logging.DEBUG, msg)
+        self._log(logging.DEBUG, msg, *args)
 
-    def info(self, msg: str):
+    def info(self, msg: str, *args):
         """Logs an informational message."""
-        self._log(logging.INFO, msg)
+        self._log(logging.INFO, msg, *args)
 
-    def warning(self, msg: str):
+    def warning(self, msg: str, *args):
         """Logs a warning message."""
-        self._log(logging.WARNING, msg)
+        self._log(logging.WARNING, msg, *args)
 
-    def error(self, msg: str):
+    def error(self, msg: str, *args):
         """Logs an error message."""
-        self._log(logging.ERROR, msg)
+        self._log(logging.ERROR, msg, *args)
 
-    def critical(self, msg: str):
+    def critical(self, msg: str, *args):
         """Logs a critical message."""
-        self._log(logging.CRITICAL, msg)
+        self._log(logging.CRITICAL, msg, *args)
 
     def log_exception(self, exc: Exception, msg: str = "Exception occurred"):
         """
         Logs an exception with the stack trace.
 
+        Nothing is built when ERROR is filtered out. Otherwise the traceback is
+        formatted once by the handlers' formatter (on the listener thread when
+        the logger is queued) and reused by every handler.
+
         Args:
             exc (Exception): The exception to log.
             msg (str, optional): Additional message to log with the exception. Defaults to "Exception occurred".
         """
-        self.logger.error(f"{msg}: {exc}", exc_info=True)
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        # The exception itself carries its traceback, so this also works outside the except block
+        self.logger.error(f"{msg}: {exc}", exc_info=exc)
 
     @staticmethod
     def set_global_log_level(level: int):
@@ -99,10 +229,13 @@ class Logger:
             max_bytes (int, optional): Maximum size in bytes of the log file before it gets rotated. Defaults to 10485760 (10MB).
             backup_count (int, optional): Number of backup files to keep. Defaults to 5.
         """
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        formatter = _FastFormatter()
         file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        if self.listener is not None:
+            self.listener.handlers += (file_handler,)
+        else:
+            self.logger.addHandler(file_handler)
 
 if __name__ == "__main__":
     # Example usage
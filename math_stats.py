@@ -1,7 +1,64 @@
+import array
+import math
 import statistics
-from typing import Union, List
+from typing import Union, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the statistics module handles every input without it
+    np = None
+
+try:
+    import numba
+except ImportError:  # numba is optional; variance and stdev fall back to NumPy or the statistics module
+    numba = None
 
 Number = Union[int, float]
+# Containers of numbers accepted by the statistics functions
+Numbers = Union[List[Number], Tuple[Number, ...], array.array, "np.ndarray"]
+
+_SEQUENCE_TYPES = (list, tuple, array.array) + ((np.ndarray,) if np is not None else ())
+
+# Lists shorter than this stay on the statistics module, where NumPy's call overhead would dominate
+VECTORIZE_THRESHOLD = 32
+
+# Array dtype kinds that only hold values the isinstance check accepts: bool, int, unsigned, float
+_NUMERIC_KINDS = 'biuf'
+
+# float64 holds every integer up to this magnitude exactly
+_FLOAT_EXACT_INT = 2 ** 53
+
+_welford = None
+if numba is not None and np is not None:
+    # Compiled once for contiguous float64 input at import and cached on disk
+    @numba.njit(numba.types.UniTuple(numba.float64, 2)(numba.float64[::1]), cache=True)
+    def _welford(arr):
+        """
+        Mean and sample variance of a float64 array in one pass with Welford's algorithm.
+
+        Parameters:
+        arr (np.ndarray): Contiguous float64 values; at least two of them.
+
+        Returns:
+        Tuple[float, float]: The mean and the sample variance.
+        """
+        mean_value = 0.0
+        m2 = 0.0
+        for i in range(arr.shape[0]):
+            x = arr[i]
+            delta = x - mean_value
+            mean_value += delta / (i + 1)
+            m2 += delta * (x - mean_value)
+        return mean_value, m2 / (arr.shape[0] - 1)
+
+class SummaryStatistics(NamedTuple):
+    """
+    Count, mean, sample variance and standard deviation of a list of numbers.
+    """
+    n: int
+    mean: float
+    variance: float
+    std: float
 
 def validate_numbers(*args: Number):
     """
@@ -16,23 +73,83 @@ def validate_numbers(*args: Number):
     if not all(isinstance(arg, (int, float)) for arg in args):
         raise TypeError("All inputs must be numbers.")
 
-def validate_list_of_numbers(data: List[Number]):
+def validate_list_of_numbers(data: Numbers) -> Optional["np.ndarray"]:
     """
-    Validate that the input is a list of numbers.
+    Validate that the input is a list (or tuple, array.array or NumPy array) of numbers.
+
+    A one-dimensional numeric NumPy array is used as it is, without a copy
+    when it already holds contiguous float64. Other containers of at least
+    VECTORIZE_THRESHOLD values are validated by NumPy's conversion to an
+    array in a single C-level pass, and the array is handed back for the
+    vectorized reductions. Anything the array's dtype cannot vouch for (an
+    object array, e.g. huge ints or mixed types) goes through the
+    per-element check. Integer arrays with a value beyond 2**53, which
+    float64 would round, are left to the exact paths.
 
     Parameters:
-    data (List[Number]): The list to validate.
+    data (Numbers): The numbers to validate.
+
+    Returns:
+    Optional[np.ndarray]: The values as a float64 array when NumPy is installed and the input is an array or long enough, otherwise None.
 
     Raises:
-    TypeError: If the input is not a list or if the list contains non-number elements.
+    TypeError: If the input is not a supported container or if it contains non-number elements.
     ValueError: If the list is empty.
     """
-    if not isinstance(data, list):
+    if not isinstance(data, _SEQUENCE_TYPES):
         raise TypeError("Input must be a list of numbers.")
-    if not data:
+    if len(data) == 0:
         raise ValueError("The list must not be empty.")
+    if np is not None:
+        arr = None
+        if isinstance(data, np.ndarray):
+            arr = data
+        elif len(data) >= VECTORIZE_THRESHOLD:
+            try:
+                arr = np.asarray(data)
+            except (ValueError, TypeError, OverflowError):
+                # Ragged nesting and the like; the element check below reports it
+                pass
+        if arr is not None and arr.ndim == 1 and arr.dtype.kind in _NUMERIC_KINDS:
+            if arr.dtype.kind in 'iu' and (arr.max() > _FLOAT_EXACT_INT or arr.min() < -_FLOAT_EXACT_INT):
+                # float64 would round these; the dtype already vouches for them, so the element check is skipped
+                return None
+            # The Welford kernel needs contiguous float64; already contiguous float64 input is not copied
+            return np.ascontiguousarray(arr, dtype=np.float64)
     if not all(isinstance(x, (int, float)) for x in data):
         raise TypeError("All elements in the list must be numbers.")
+    return None
+
+def _exact_values(data: Numbers) -> Numbers:
+    """
+    Values for the exact paths: a NumPy array's elements as Python ints and floats, which the statistics module handles without overflow.
+    """
+    return data.tolist() if np is not None and isinstance(data, np.ndarray) else data
+
+def _all_ints(data: Numbers) -> bool:
+    """
+    Check whether every value is a plain int, so exact integer arithmetic can replace statistics' Fractions.
+    """
+    return all(type(x) is int for x in data)
+
+def _int_ratio(numerator: int, denominator: int) -> Number:
+    """
+    Divide two ints exactly the way the statistics module reports results: an int when exact, else the correctly rounded float.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    return quotient if remainder == 0 else numerator / denominator
+
+def _int_moments(data: Numbers) -> Tuple[Number, Number]:
+    """
+    Exact mean and sample variance of two or more ints, matching the statistics module's results.
+
+    The variance is (n * sum(x^2) - sum(x)^2) / (n * (n - 1)) in integer
+    arithmetic, with no Fraction per element.
+    """
+    n = len(data)
+    total = sum(data)
+    total_squares = sum(x * x for x in data)
+    return _int_ratio(total, n), _int_ratio(n * total_squares - total * total, n * (n - 1))
 
 def add(a: Number, b: Number) -> Number:
     """
@@ -64,21 +181,26 @@ def divide(a: Number, b: Number) -> Number:
         raise ZeroDivisionError("The second input must not be zero.")
     return a / b
 
-def mean(data: List[Number]) -> float:
+def mean(data: Numbers) -> float:
     """
     Calculate the mean of a list of numbers.
     """
-    validate_list_of_numbers(data)
+    arr = validate_list_of_numbers(data)
+    if arr is not None:
+        return float(arr.mean())
+    data = _exact_values(data)
+    if _all_ints(data):
+        return _int_ratio(sum(data), len(data))
     return statistics.mean(data)
 
-def median(data: List[Number]) -> float:
+def median(data: Numbers) -> float:
     """
     Calculate the median of a list of numbers.
     """
     validate_list_of_numbers(data)
     return statistics.median(data)
 
-def mode(data: List[Number]) -> Number:
+def mode(data: Numbers) -> Number:
     """
     Calculate the mode of a list of numbers.
     """
@@ -88,32 +210,91 @@ def mode(data: List[Number]) -> Number:
     except statistics.StatisticsError:
         raise ValueError("No unique mode found in the list.")
 
-def variance(data: List[Number]) -> float:
+def variance(data: Numbers) -> float:
     """
     Calculate the variance of a list of numbers.
     """
-    validate_list_of_numbers(data)
+    arr = validate_list_of_numbers(data)
+    if arr is not None:
+        if arr.size < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        if _welford is not None:
+            return _welford(arr)[1]
+        return float(arr.var(ddof=1))
+    data = _exact_values(data)
+    if len(data) > 1 and _all_ints(data):
+        return _int_moments(data)[1]
     return statistics.variance(data)
 
-def standard_deviation(data: List[Number]) -> float:
+def standard_deviation(data: Numbers) -> float:
     """
     Calculate the standard deviation of a list of numbers.
     """
-    validate_list_of_numbers(data)
+    arr = validate_list_of_numbers(data)
+    if arr is not None:
+        if arr.size < 2:
+            raise statistics.StatisticsError("stdev requires at least two data points")
+        if _welford is not None:
+            return math.sqrt(_welford(arr)[1])
+        return float(arr.std(ddof=1))
+    data = _exact_values(data)
     return statistics.stdev(data)
 
-def harmonic_mean(data: List[Number]) -> float:
+def summary_statistics(data: Numbers) -> SummaryStatistics:
+    """
+    Calculate the count, mean, variance and standard deviation of a list of numbers together.
+
+    Prefer this over separate mean/variance/standard_deviation calls when more
+    than one is needed: the list is validated and converted once, and with
+    numba installed all moments come from a single pass over the values.
+
+    Raises:
+    statistics.StatisticsError: If the list has fewer than two numbers.
+    """
+    arr = validate_list_of_numbers(data)
+    if arr is not None:
+        if arr.size < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        if _welford is not None:
+            mean_value, variance_value = _welford(arr)
+        else:
+            mean_value, variance_value = float(arr.mean()), float(arr.var(ddof=1))
+        return SummaryStatistics(len(data), mean_value, variance_value, math.sqrt(variance_value))
+    data = _exact_values(data)
+    if len(data) > 1 and _all_ints(data):
+        mean_value, variance_value = _int_moments(data)
+    else:
+        mean_value = statistics.mean(data)
+        # Passing the mean saves statistics.variance a pass of its own
+        variance_value = statistics.variance(data, mean_value)
+    return SummaryStatistics(len(data), mean_value, variance_value, math.sqrt(variance_value))
+
+def harmonic_mean(data: Numbers) -> float:
     """
     Calculate the harmonic mean of a list of numbers.
     """
-    validate_list_of_numbers(data)
+    arr = validate_list_of_numbers(data)
+    if arr is not None:
+        if (arr < 0).any():
+            raise statistics.StatisticsError("harmonic mean does not support negative values")
+        if not arr.all():
+            # statistics.harmonic_mean also returns 0 as soon as any value is zero
+            return 0.0
+        return float(arr.size / np.reciprocal(arr).sum())
+    data = _exact_values(data)
     return statistics.harmonic_mean(data)
 
-def geometric_mean(data: List[Number]) -> float:
+def geometric_mean(data: Numbers) -> float:
     """
     Calculate the geometric mean of a list of numbers.
     """
-    validate_list_of_numbers(data)
+    arr = validate_list_of_numbers(data)
+    if arr is not None:
+        if (arr <= 0).any():
+            raise statistics.StatisticsError("geometric mean requires a non-empty dataset containing positive numbers")
+        # Averaged in log space so the product cannot overflow
+        return float(np.exp(np.log(arr).mean()))
+    data = _exact_values(data)
     return statistics.geometric_mean(data)
 
 if __name__ == "__main__":
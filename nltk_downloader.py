@@ -2,22 +2,54 @@ import nltk
 from nltk.corpus import wordnet as wn
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
+import functools
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+# English stopwords, loaded from the corpus on first use by _get_stopwords
+_STOPWORDS = None
+
+# Required NLTK resources and the data path each one is installed under
+_RESOURCE_PATHS = {
+    'wordnet': 'corpora/wordnet',
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+}
+
 def download_nltk_resources():
     """
     Download the required NLTK resources: wordnet, punkt, and stopwords.
+
+    Resources that are already installed are found locally and skipped, so
+    repeated runs make no network requests.
     """
-    resources = ['wordnet', 'punkt', 'stopwords']
-    for resource in resources:
+    for resource, path in _RESOURCE_PATHS.items():
         try:
-            nltk.download(resource)
+            nltk.data.find(path)
+            logging.debug(f"NLTK resource '{resource}' is already installed.")
+            continue
+        except LookupError:
+            pass
+        try:
+            nltk.download(resource, quiet=True, raise_on_error=True)
             logging.info(f"NLTK resource '{resource}' downloaded successfully.")
         except Exception as e:
             logging.error(f"Error downloading NLTK resource '{resource}': {e}")
 
+@functools.lru_cache(maxsize=8192)
+def _synonyms(word):
+    """
+    Look up the WordNet lemma names for a word; memoized because the lookup is pure.
+
+    Parameters:
+    word (str): The word to find synonyms for.
+
+    Returns:
+    tuple: The distinct lemma names.
+    """
+    return tuple({lemma.name() for syn in wn.synsets(word) for lemma in syn.lemmas()})
+
 def get_synonyms(word):
     """
     Get synonyms for a given word using WordNet.
@@ -28,14 +60,12 @@ def get_synonyms(word):
     Returns:
     list: A list of synonyms.
     """
-    synonyms = set()
     try:
-        for syn in wn.synsets(word):
-            for lemma in syn.lemmas():
-                synonyms.add(lemma.name())
+        # A fresh list each call, so callers cannot modify the cached result
+        return list(_synonyms(word))
     except Exception as e:
         logging.error(f"Error getting synonyms for word '{word}': {e}")
-    return list(synonyms)
+        return []
 
 def tokenize_text(text):
     """
@@ -53,6 +83,21 @@ def tokenize_text(text):
         logging.error(f"Error tokenizing text: {e}")
         return []
 
+def _get_stopwords():
+    """
+    Return the English stopwords, reading the corpus only on the first call.
+
+    Nothing is cached while the corpus is missing, so a later call after
+    download_nltk_resources() picks it up.
+
+    Returns:
+    frozenset: The lowercase English stopwords.
+    """
+    global _STOPWORDS
+    if _STOPWORDS is None:
+        _STOPWORDS = frozenset(word.lower() for word in stopwords.words('english'))
+    return _STOPWORDS
+
 def remove_stopwords(tokens):
     """
     Remove stopwords from a list of tokens.
@@ -64,7 +109,7 @@ def remove_stopwords(tokens):
     list: A list of tokens with stopwords removed.
     """
     try:
-        stop_words = set(stopwords.words('english'))
+        stop_words = _get_stopwords()
         return [token for token in tokens if token.lower() not in stop_words]
     except Exception as e:
         logging.error(f"Error removing stopwords: {e}")
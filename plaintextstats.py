@@ -1,10 +1,70 @@
+import math
 import statistics
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the statistics module is used instead
+    np = None
+
+try:
+    import numba
+except ImportError:  # numba is optional; plain NumPy reductions are used instead
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _fused_moments(arr) -> Tuple[Any, Any, float, float]:
+        """Returns min, max, mean and the sum of squared deviations in one pass (Welford)."""
+        lo = arr[0]
+        hi = arr[0]
+        mean = 0.0
+        m2 = 0.0
+        for i in range(arr.size):
+            x = arr[i]
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        return lo, hi, mean, m2
+else:
+    _fused_moments = None
+
+# float64 holds every integer up to this magnitude exactly
+_FLOAT_EXACT_INT = 2 ** 53
+
+# Lists shorter than this stay on the statistics module, where NumPy's call overhead would dominate
+VECTORIZE_THRESHOLD = 32
+
+def _int_mean(arr, lo: int, hi: int):
+    """Exact mean of an int array as statistics.mean reports it: an int when exact, else the correctly rounded float."""
+    n = arr.size
+    # An int64 sum is exact unless n values of this magnitude could overflow it
+    total = int(arr.sum(dtype=np.int64)) if n * max(abs(lo), abs(hi)) < 2 ** 63 else sum(arr.tolist())
+    quotient, remainder = divmod(total, n)
+    return quotient if remainder == 0 else total / n
+
+def _int_median(arr):
+    """Median of an int array as statistics.median reports it: the middle int for odd sizes, else a float."""
+    n = arr.size
+    if n % 2:
+        return np.partition(arr, n // 2)[n // 2].item()
+    return float(np.median(arr))
 
 def calculate_statistics(numbers: List[int]) -> Dict[str, Any]:
     """
     Calculate and return statistical measures for a list of integers.
 
+    When NumPy is available, lists of at least VECTORIZE_THRESHOLD values
+    are converted to an array once and every measure is computed on it
+    (min, max, mean and deviation in a single Numba-compiled pass if Numba
+    is installed); shorter lists, and ints beyond 2**53, use the statistics
+    module. Both paths report an int mean or median wherever the statistics
+    module would.
+
     Args:
     numbers (List[int]): A list of integers.
 
@@ -14,6 +74,28 @@ def calculate_statistics(numbers: List[int]) -> Dict[str, Any]:
     if not numbers:
         raise ValueError("The list of numbers is empty.")
 
+    if np is not None and len(numbers) >= VECTORIZE_THRESHOLD:
+        arr = np.asarray(numbers)
+        # Object arrays (e.g. ints beyond int64) gain nothing from NumPy
+        if arr.dtype.kind in 'iuf':
+            if _fused_moments is not None:
+                lo, hi, mean, m2 = _fused_moments(arr)
+                std_dev = math.sqrt(m2 / (arr.size - 1))
+            else:
+                lo, hi = arr.min().item(), arr.max().item()
+                mean, std_dev = float(arr.mean()), float(arr.std(ddof=1))
+            if arr.dtype.kind == 'f':
+                return {"min": lo, "max": hi, "mean": mean, "median": float(np.median(arr)), "std_dev": std_dev}
+            # Ints beyond 2**53 would be rounded by the float mean and deviation; the statistics module keeps them exact
+            if -_FLOAT_EXACT_INT <= lo and hi <= _FLOAT_EXACT_INT:
+                return {
+                    "min": lo,
+                    "max": hi,
+                    "mean": _int_mean(arr, lo, hi),
+                    "median": _int_median(arr),
+                    "std_dev": std_dev
+                }
+
     stats = {
         "min": min(numbers),
         "max": max(numbers),
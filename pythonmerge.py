@@ -12,10 +12,7 @@ def merge_dictionaries(dict1: Dict[str, int], dict2: Dict[str, int]) -> Dict[str
         Dict[str, int]: A new dictionary containing all keys from both input dictionaries.
                         The values of common keys are summed.
     """
-    merged_dict = dict1.copy()  # Start with a copy of the first dictionary
-    for key, value in dict2.items():
-        if key in merged_dict:
-            merged_dict[key] += value
-        else:
-            merged_dict[key] = value
+    merged_dict = dict1 | dict2  # Bulk-insert every key in C
+    for key in dict1.keys() & dict2.keys():  # Only common keys need summing
+        merged_dict[key] = dict1[key] + dict2[key]
     return merged_dict
@@ -1,35 +1,66 @@
-from PIL import Image
 import os
 
-def resize_image(input_path: str, output_path: str, width: int, height: int) -> None:
+from PIL import Image
+
+try:
+    import pyvips
+except ImportError:  # pyvips is optional; only needed for use_vips=True
+    pyvips = None
+
+def resize_image(input_path: str, output_path: str, width: int, height: int, use_vips: bool = False) -> None:
     """
     Resize an image to the given width and height.
 
+    The Pillow path resamples with BICUBIC, which Pillow-SIMD (a drop-in
+    replacement for Pillow) runs with SSE4/AVX2 kernels.
+
     Args:
         input_path (str): Path to the input image file.
         output_path (str): Path to save the resized image.
         width (int): The desired width of the resized image.
         height (int): The desired height of the resized image.
+        use_vips (bool, optional): Resize with libvips through pyvips instead. It streams the
+            pixels and shrinks JPEGs while decoding, which is much faster and lighter on memory
+            for large downscales; its resampling kernel differs slightly from Pillow's.
+            Defaults to False.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
         ValueError: If the width or height is not positive.
+        ImportError: If use_vips is True and pyvips is not installed.
 
     Example:
         resize_image("input.jpg", "output.jpg", 800, 600)
     """
-    # Check if input file exists
-    if not os.path.isfile(input_path):
-        raise FileNotFoundError(f"No such file: '{input_path}'")
-    
     # Check if width and height are positive
     if width <= 0 or height <= 0:
         raise ValueError("Width and height must be positive integers")
 
-    # Open the input image
-    with Image.open(input_path) as img:
-        # Resize the image
-        resized_img = img.resize((width, height))
+    if use_vips:
+        if pyvips is None:
+            raise ImportError("use_vips requires pyvips (pip install pyvips).")
+        try:
+            # Exact size like Image.resize, and no EXIF auto-rotation, which Pillow does not do either
+            resized = pyvips.Image.thumbnail(input_path, width, height=height, size='force', no_rotate=True)
+        except pyvips.Error:
+            if not os.path.isfile(input_path):
+                raise FileNotFoundError(f"No such file: '{input_path}'")
+            raise
+        resized.write_to_file(output_path)
+        return
+
+    # Open the input image; a missing file surfaces from open() itself
+    try:
+        img = Image.open(input_path)
+    except (FileNotFoundError, IsADirectoryError):
+        raise FileNotFoundError(f"No such file: '{input_path}'")
+
+    with img:
+        # For JPEGs, let libjpeg decode at 1/2, 1/4 or 1/8 scale while keeping twice the
+        # target size for the resampling filter; a no-op for other formats and upscales
+        img.draft(img.mode, (width * 2, height * 2))
+        # Resize the image; BICUBIC is Pillow's default, named so the SIMD kernel choice is explicit
+        resized_img = img.resize((width, height), resample=Image.Resampling.BICUBIC)
         # Save the resized image to the output path
         resized_img.save(output_path)
 
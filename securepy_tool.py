@@ -1,18 +1,51 @@
 import os
 import hashlib
+import hmac
 import base64
 import logging
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Optional, Union
 from Crypto.Cipher import AES
-from Crypto.Random import get_random_bytes
 from Crypto.Protocol.KDF import scrypt
+from Crypto.Util.Padding import unpad
+
+try:
+    from argon2.low_level import Type, hash_secret_raw
+except ImportError:  # argon2-cffi is optional; only needed for algorithm='argon2id'
+    hash_secret_raw = None
+
+# argon2id cost parameters used by hash_password (64 MiB, 3 passes, 4 lanes)
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 65536
+ARGON2_PARALLELISM = 4
+
+# PBKDF2-HMAC-SHA256 iteration count used by hash_password with algorithm='pbkdf2_sha256'
+PBKDF2_ITERATIONS = 600000
+
+# batch_hash_data spreads work over threads only for at least this many blobs and bytes in total
+_BATCH_HASH_MIN_BLOBS = 4
+_BATCH_HASH_MIN_BYTES = 1 << 20
+
+# Layout of encrypt_data_gcm output: PyCryptodome's default 16-byte nonce and 16-byte tag around the ciphertext
+_GCM_NONCE_SIZE = 16
+_GCM_TAG_SIZE = 16
+
+# Bound once at import so the per-call paths skip the AES attribute lookups
+_BLOCK_SIZE = AES.block_size
+_MODE_CBC = AES.MODE_CBC
+_MODE_GCM = AES.MODE_GCM
+_AES_new = AES.new
+# Reads the OS CSPRNG directly, without PyCryptodome's Python-level wrapper
+_token_bytes = secrets.token_bytes
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class SecurePy:
     """A utility class providing encryption, decryption, hashing, and secure password storage functionalities."""
 
+    __slots__ = ()
+
     @staticmethod
     def generate_random_key(length: int = 32) -> bytes:
         """
@@ -24,8 +57,8 @@ class SecurePy:
         """
         if length <= 0:
             raise ValueError("Key length must be a positive integer.")
-        key = get_random_bytes(length)
-        logger.info(f"Generated random key of length {length}")
+        key = _token_bytes(length)
+        logger.debug("Generated random key of length %d", length)
         return key
 
     @staticmethod
@@ -41,20 +74,24 @@ class SecurePy:
         if not data or not key:
             raise ValueError("Data and key must not be empty.")
         
-        cipher = AES.new(key, AES.MODE_CBC)
+        cipher = _AES_new(key, _MODE_CBC)
         iv = cipher.iv
 
-        # Padding data to be multiple of AES block size
-        padding_length = AES.block_size - len(data) % AES.block_size
-        data += bytes([padding_length]) * padding_length
+        # Padding data to be multiple of AES block size; only the last partial block is copied
+        padding_length = _BLOCK_SIZE - len(data) % _BLOCK_SIZE
+        full_length = len(data) + padding_length - _BLOCK_SIZE
+        tail = bytes(data[full_length:]) + bytes([padding_length]) * padding_length
 
-        try:
-            ciphertext = cipher.encrypt(data)
-            logger.info("Data encrypted successfully")
-            return iv + ciphertext
-        except Exception as e:
-            logger.exception("Encryption failed")
-            raise
+        # IV and ciphertext are written into one preallocated buffer instead of being concatenated
+        out = bytearray(len(iv) + full_length + _BLOCK_SIZE)
+        out[:len(iv)] = iv
+        view = memoryview(out)
+        if full_length:
+            cipher.encrypt(memoryview(data)[:full_length], output=view[len(iv):len(iv) + full_length])
+        cipher.encrypt(tail, output=view[len(iv) + full_length:])
+        view.release()
+        logger.debug("Data encrypted successfully")
+        return bytes(out)
 
     @staticmethod
     def decrypt_data(encrypted_data: bytes, key: bytes) -> bytes:
@@ -68,46 +105,143 @@ class SecurePy:
         """
         if not encrypted_data or not key:
             raise ValueError("Encrypted data and key must not be empty.")
-        if len(encrypted_data) < AES.block_size:
+        if len(encrypted_data) < _BLOCK_SIZE:
             raise ValueError("Invalid encrypted data.")
         
-        iv = encrypted_data[:AES.block_size]
-        ciphertext = encrypted_data[AES.block_size:]
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-
-        try:
-            data = cipher.decrypt(ciphertext)
-            # Remove padding
-            padding_length = data[-1]
-            if padding_length > AES.block_size:
-                raise ValueError("Invalid padding length.")
-            data = data[:-padding_length]
-            logger.info("Data decrypted successfully")
-            return data
-        except Exception as e:
-            logger.exception("Decryption failed")
-            raise
+        # Sliced through a memoryview so the ciphertext is not copied before decryption
+        view = memoryview(encrypted_data)
+        iv = bytes(view[:_BLOCK_SIZE])
+        ciphertext = view[_BLOCK_SIZE:]
+        cipher = _AES_new(key, _MODE_CBC, iv)
+
+        # unpad checks every PKCS#7 padding byte, not only the length byte
+        data = unpad(cipher.decrypt(ciphertext), _BLOCK_SIZE)
+        logger.debug("Data decrypted successfully")
+        return data
 
     @staticmethod
-    def hash_data(data: bytes) -> str:
+    def encrypt_data_gcm(data: bytes, key: bytes, aad: bytes = b'') -> bytes:
+        """
+        Encrypt and authenticate data using AES (GCM mode) with the provided key.
+
+        GCM encrypts in counter mode, so unlike CBC the blocks are independent
+        and AES-NI can pipeline them; the tag is computed with carry-less
+        multiplication (PCLMULQDQ). No padding is needed, and tampering is
+        detected on decryption. Encryption and authentication happen in one
+        pass, so prefer this over encrypt_data plus a separate hash_data.
+
+        :param data: Data to be encrypted.
+        :param key: Encryption key.
+        :param aad: Associated data that is authenticated but not encrypted (default is none).
+        :return: Encrypted data (nonce + ciphertext + tag).
+        :raises ValueError: If data or key is empty.
+        """
+        if not data or not key:
+            raise ValueError("Data and key must not be empty.")
+
+        cipher = _AES_new(key, _MODE_GCM)
+        if aad:
+            cipher.update(aad)
+        ciphertext, tag = cipher.encrypt_and_digest(data)
+        logger.debug("Data encrypted successfully")
+        return b"".join((cipher.nonce, ciphertext, tag))
+
+    @staticmethod
+    def decrypt_data_gcm(encrypted_data: bytes, key: bytes, aad: bytes = b'') -> bytes:
+        """
+        Decrypt and verify data produced by encrypt_data_gcm.
+
+        :param encrypted_data: Data to be decrypted (nonce + ciphertext + tag).
+        :param key: Decryption key.
+        :param aad: The associated data passed to encrypt_data_gcm (default is none).
+        :return: Decrypted data.
+        :raises ValueError: If encrypted data or key is empty, or if the data fails authentication.
+        """
+        if not encrypted_data or not key:
+            raise ValueError("Encrypted data and key must not be empty.")
+        if len(encrypted_data) < _GCM_NONCE_SIZE + _GCM_TAG_SIZE:
+            raise ValueError("Invalid encrypted data.")
+
+        view = memoryview(encrypted_data)
+        nonce = bytes(view[:_GCM_NONCE_SIZE])
+        ciphertext = view[_GCM_NONCE_SIZE:-_GCM_TAG_SIZE]
+        tag = bytes(view[-_GCM_TAG_SIZE:])
+        cipher = _AES_new(key, _MODE_GCM, nonce=nonce)
+        if aad:
+            cipher.update(aad)
+
+        data = cipher.decrypt_and_verify(ciphertext, tag)
+        logger.debug("Data decrypted successfully")
+        return data
+
+    @staticmethod
+    def hash_data(data: Union[bytes, BinaryIO]) -> str:
         """
         Generate a SHA-256 hash of the provided data.
 
-        :param data: Data to be hashed.
+        A binary file object is hashed with hashlib.file_digest, which reads it
+        in chunks, so a file never has to be loaded into memory whole. Bytes-like
+        objects, memoryview included, are hashed without a copy.
+
+        :param data: Data to be hashed, or a file object opened in binary mode.
         :return: SHA-256 hash of the data.
         :raises ValueError: If data is empty.
         """
+        if hasattr(data, 'read'):
+            hash_hex = hashlib.file_digest(data, 'sha256').hexdigest()
+            logger.debug("Data hashed successfully")
+            return hash_hex
         if not data:
             raise ValueError("Data must not be empty.")
         
-        try:
-            hash_object = hashlib.sha256(data)
-            hash_hex = hash_object.hexdigest()
-            logger.info("Data hashed successfully")
-            return hash_hex
-        except Exception as e:
-            logger.exception("Hashing failed")
-            raise
+        hash_object = hashlib.sha256(data)
+        hash_hex = hash_object.hexdigest()
+        logger.debug("Data hashed successfully")
+        return hash_hex
+
+    @staticmethod
+    def batch_hash_data(blobs: List[bytes]) -> List[str]:
+        """
+        Generate SHA-256 hashes of several independent inputs.
+
+        hashlib releases the GIL while hashing large buffers, so big batches
+        are hashed on a thread pool, one core per input; small batches are
+        hashed in a loop, where a pool would cost more than it saves.
+
+        :param blobs: Data to be hashed.
+        :return: SHA-256 hash of each input, in the order given.
+        :raises ValueError: If any input is empty.
+        """
+        if not all(blobs):
+            raise ValueError("Data must not be empty.")
+
+        def digest(blob):
+            return hashlib.sha256(blob).hexdigest()
+
+        if len(blobs) < _BATCH_HASH_MIN_BLOBS or sum(map(len, blobs)) < _BATCH_HASH_MIN_BYTES:
+            hashes = [digest(blob) for blob in blobs]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(blobs), os.cpu_count() or 1)) as pool:
+                hashes = list(pool.map(digest, blobs))
+        logger.debug("Data hashed successfully")
+        return hashes
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """
+        Generate a SHA-256 hash of a file's contents without loading it into memory.
+
+        The file is read unbuffered into one reused buffer by hashlib.file_digest;
+        hashlib's OpenSSL backend uses the CPU's SHA extensions where available.
+
+        :param path: Path of the file to be hashed.
+        :return: SHA-256 hash of the file's contents.
+        :raises OSError: If the file cannot be read.
+        """
+        with open(path, 'rb', buffering=0) as file:
+            hash_hex = hashlib.file_digest(file, 'sha256').hexdigest()
+        logger.debug("Data hashed successfully")
+        return hash_hex
 
     @staticmethod
     def generate_salt(length: int = 16) -> bytes:
@@ -121,61 +255,246 @@ class SecurePy:
         if length <= 0:
             raise ValueError("Salt length must be a positive integer.")
         
-        try:
-            salt = get_random_bytes(length)
-            logger.info(f"Generated salt of length {length}")
-            return salt
-        except Exception as e:
-            logger.exception("Salt generation failed")
-            raise
+        salt = _token_bytes(length)
+        logger.debug("Generated salt of length %d", length)
+        return salt
 
     @staticmethod
-    def hash_password(password: str, salt: bytes, length: int = 32, N: int = 2**14, r: int = 8, p: int = 1) -> str:
+    def hash_password_raw(password: str, salt: bytes, length: int = 32, N: int = 2**14, r: int = 8, p: int = 1, algorithm: str = 'scrypt') -> bytes:
         """
-        Hash a password with a salt using scrypt.
+        Hash a password with a salt using scrypt, or argon2id, and return the raw digest.
+
+        Use this instead of hash_password when the hash is stored or compared
+        as bytes; it skips the base64 encoding.
 
         :param password: Password to be hashed.
-        :param salt: Salt to be used in hashing.
+        :param salt: Salt to be used in hashing (at least 8 bytes for argon2id).
         :param length: Desired length of the hash (default is 32 bytes).
-        :param N: CPU/memory cost parameter (default is 2^14).
-        :param r: Block size parameter (default is 8).
-        :param p: Parallelization parameter (default is 1).
-        :return: Hashed password.
-        :raises ValueError: If password, salt, or length are invalid.
+        :param N: CPU/memory cost parameter (default is 2^14); scrypt only.
+        :param r: Block size parameter (default is 8); scrypt only.
+        :param p: Parallelization parameter (default is 1); scrypt only.
+        :param algorithm: 'scrypt' (default), 'argon2id' or 'pbkdf2_sha256'.
+        :return: Hashed password as bytes.
+        :raises ValueError: If password, salt, length or algorithm are invalid.
+        :raises ImportError: If algorithm is 'argon2id' and argon2-cffi is not installed.
         """
         if not password or not salt:
             raise ValueError("Password and salt must not be empty.")
         if length <= 0:
             raise ValueError("Hash length must be a positive integer.")
+        if algorithm not in ('scrypt', 'argon2id', 'pbkdf2_sha256'):
+            raise ValueError("Algorithm must be 'scrypt', 'argon2id' or 'pbkdf2_sha256'.")
+        if algorithm == 'argon2id' and hash_secret_raw is None:
+            raise ImportError("algorithm='argon2id' requires argon2-cffi (pip install argon2-cffi).")
         
-        try:
+        if algorithm == 'argon2id':
+            hashed_password = hash_secret_raw(
+                password.encode(), salt,
+                time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST,
+                parallelism=ARGON2_PARALLELISM, hash_len=length, type=Type.ID,
+            )
+        elif algorithm == 'pbkdf2_sha256':
+            hashed_password = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS, length)
+        else:
             hashed_password = scrypt(password.encode(), salt, length, N=N, r=r, p=p)
-            hashed_password_base64 = base64.b64encode(hashed_password).decode('utf-8')
-            logger.info("Password hashed successfully")
-            return hashed_password_base64
-        except Exception as e:
-            logger.exception("Password hashing failed")
-            raise
+        logger.debug("Password hashed successfully")
+        return hashed_password
+
+    @staticmethod
+    def hash_password(password: str, salt: bytes, length: int = 32, N: int = 2**14, r: int = 8, p: int = 1, algorithm: str = 'scrypt') -> str:
+        """
+        Hash a password with a salt using scrypt, or argon2id.
+
+        argon2id runs in argon2-cffi's SIMD C implementation with
+        ARGON2_TIME_COST, ARGON2_MEMORY_COST and ARGON2_PARALLELISM, and is the
+        better choice for new password stores (see hash_password_argon2). scrypt
+        stays the default only so existing password hashes keep verifying.
+
+        pbkdf2_sha256 runs PBKDF2_ITERATIONS rounds in OpenSSL, which computes
+        the HMAC key schedule once per call rather than once per round; it suits
+        deployments that must be PBKDF2-compatible. Keep length at 32 bytes or
+        less with it, as every further 32 bytes repeats all the iterations.
+
+        :param password: Password to be hashed.
+        :param salt: Salt to be used in hashing (at least 8 bytes for argon2id).
+        :param length: Desired length of the hash (default is 32 bytes).
+        :param N: CPU/memory cost parameter (default is 2^14); scrypt only.
+        :param r: Block size parameter (default is 8); scrypt only.
+        :param p: Parallelization parameter (default is 1); scrypt only.
+        :param algorithm: 'scrypt' (default), 'argon2id' or 'pbkdf2_sha256'.
+        :return: Hashed password, base64-encoded.
+        :raises ValueError: If password, salt, length or algorithm are invalid.
+        :raises ImportError: If algorithm is 'argon2id' and argon2-cffi is not installed.
+        """
+        hashed_password = SecurePy.hash_password_raw(password, salt, length, N, r, p, algorithm)
+        return base64.b64encode(hashed_password).decode('utf-8')
+
+    @staticmethod
+    def hash_password_argon2(password: str, salt: bytes, time_cost: int = ARGON2_TIME_COST, memory_cost: int = ARGON2_MEMORY_COST, parallelism: int = ARGON2_PARALLELISM, length: int = 32) -> str:
+        """
+        Hash a password with a salt using argon2id.
+
+        Recommended for new password stores over scrypt: argon2-cffi runs the
+        reference C implementation with SIMD, and parallelism sets how many
+        lanes it fills in parallel.
+
+        :param password: Password to be hashed.
+        :param salt: Salt to be used in hashing (at least 8 bytes).
+        :param time_cost: Number of passes over memory (default is 3).
+        :param memory_cost: Memory used in KiB (default is 64 MiB).
+        :param parallelism: Number of parallel lanes (default is 4).
+        :param length: Desired length of the hash (default is 32 bytes).
+        :return: Hashed password.
+        :raises ValueError: If password, salt or length are invalid.
+        :raises ImportError: If argon2-cffi is not installed.
+        """
+        if not password or not salt:
+            raise ValueError("Password and salt must not be empty.")
+        if length <= 0:
+            raise ValueError("Hash length must be a positive integer.")
+        if hash_secret_raw is None:
+            raise ImportError("argon2id hashing requires argon2-cffi (pip install argon2-cffi).")
+
+        hashed_password = hash_secret_raw(
+            password.encode(), salt,
+            time_cost=time_cost, memory_cost=memory_cost,
+            parallelism=parallelism, hash_len=length, type=Type.ID,
+        )
+        hashed_password_base64 = base64.b64encode(hashed_password).decode('utf-8')
+        logger.debug("Password hashed successfully")
+        return hashed_password_base64
+
+    @staticmethod
+    def verify_password(password: str, salt: bytes, hashed_password: Union[str, bytes], **kwargs) -> bool:
+        """
+        Check a password against a hash from hash_password, in constant time.
+
+        :param password: Password to be checked.
+        :param salt: Salt the hash was made with.
+        :param hashed_password: Hash returned by hash_password, or the bytes returned by hash_password_raw.
+        :param kwargs: The same length, N, r, p and algorithm arguments the hash was made with.
+        :return: True if the password matches, False otherwise (including a malformed stored hash).
+        """
+        if isinstance(hashed_password, str):
+            try:
+                hashed_password = base64.b64decode(hashed_password, validate=True)
+            except ValueError:
+                return False
+        # Compared as raw digests, so no base64 encoding is done per attempt
+        candidate = SecurePy.hash_password_raw(password, salt, **kwargs)
+        return hmac.compare_digest(candidate, hashed_password)
+
+    @staticmethod
+    def batch_hash_passwords(passwords: List[str], salts: List[bytes], length: int = 32, N: int = 2**14, r: int = 8, p: int = 1, algorithm: str = 'scrypt', max_workers: Optional[int] = None) -> List[str]:
+        """
+        Hash several passwords, each with its own salt, concurrently.
+
+        Both KDFs run their memory-hard core in C without holding the GIL, so
+        a thread pool hashes one password per core. Every result is identical
+        to hash_password with the same arguments.
+
+        :param passwords: Passwords to be hashed.
+        :param salts: One salt per password.
+        :param length: Desired length of each hash (default is 32 bytes).
+        :param N: CPU/memory cost parameter (default is 2^14); scrypt only.
+        :param r: Block size parameter (default is 8); scrypt only.
+        :param p: Parallelization parameter (default is 1); scrypt only.
+        :param algorithm: 'scrypt' (default), 'argon2id' or 'pbkdf2_sha256'.
+        :param max_workers: Number of worker threads (default is the CPU count).
+        :return: Hashed passwords, in the order given.
+        :raises ValueError: If the number of passwords and salts differ, or as hash_password does.
+        """
+        if len(passwords) != len(salts):
+            raise ValueError("Each password must have exactly one salt.")
+        if len(passwords) < 2:
+            return [SecurePy.hash_password(password, salt, length, N, r, p, algorithm) for password, salt in zip(passwords, salts)]
+
+        def hash_one(password, salt):
+            return SecurePy.hash_password(password, salt, length, N, r, p, algorithm)
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(passwords), os.cpu_count() or 1)) as pool:
+            return list(pool.map(hash_one, passwords, salts))
+
+class PreparedAESCipher:
+    """
+    AES-GCM encryption of many messages under one key.
+
+    The key is validated once, and each message gets a fresh nonce. Output
+    matches SecurePy.encrypt_data_gcm (nonce + ciphertext + tag), so the two
+    can be mixed freely. PyCryptodome has no way to reuse an expanded key
+    across nonces, so the per-message saving is the validation and lookups.
+    """
+
+    __slots__ = ('_key',)
+
+    def __init__(self, key: bytes):
+        """
+        :param key: Encryption key (16, 24 or 32 bytes).
+        :raises ValueError: If the key is empty or not a valid AES key length.
+        """
+        if not key:
+            raise ValueError("Key must not be empty.")
+        if len(key) not in AES.key_size:
+            raise ValueError("Key must be 16, 24 or 32 bytes long.")
+        self._key = bytes(key)
+
+    def encrypt_many(self, plaintexts: List[bytes]) -> List[bytes]:
+        """
+        Encrypt and authenticate each message with its own nonce.
+
+        :param plaintexts: Data to be encrypted.
+        :return: Encrypted data (nonce + ciphertext + tag) for each message, in the order given.
+        :raises ValueError: If any message is empty.
+        """
+        if not all(plaintexts):
+            raise ValueError("Data must not be empty.")
+
+        key, new = self._key, _AES_new
+        out = []
+        for data in plaintexts:
+            cipher = new(key, _MODE_GCM)
+            ciphertext, tag = cipher.encrypt_and_digest(data)
+            out.append(b"".join((cipher.nonce, ciphertext, tag)))
+        logger.debug("Encrypted %d messages", len(out))
+        return out
+
+    def decrypt_many(self, encrypted: List[bytes]) -> List[bytes]:
+        """
+        Decrypt and verify messages produced by encrypt_many or SecurePy.encrypt_data_gcm.
+
+        :param encrypted: Data to be decrypted (nonce + ciphertext + tag each).
+        :return: Decrypted data, in the order given.
+        :raises ValueError: If any message is too short or fails authentication.
+        """
+        key, new = self._key, _AES_new
+        out = []
+        for data in encrypted:
+            if len(data) < _GCM_NONCE_SIZE + _GCM_TAG_SIZE:
+                raise ValueError("Invalid encrypted data.")
+            view = memoryview(data)
+            cipher = new(key, _MODE_GCM, nonce=bytes(view[:_GCM_NONCE_SIZE]))
+            out.append(cipher.decrypt_and_verify(view[_GCM_NONCE_SIZE:-_GCM_TAG_SIZE], bytes(view[-_GCM_TAG_SIZE:])))
+        logger.debug("Decrypted %d messages", len(out))
+        return out
 
 if __name__ == "__main__":
+    # Library code leaves the root logger alone; only the example configures it
+    logging.basicConfig(level=logging.INFO)
+
     # Example usage
     try:
         # Generate a random key
         key = SecurePy.generate_random_key()
 
-        # Encrypt data
+        # Encrypt and authenticate data in one pass; no separate hash is needed
         data = b"Secret Data"
-        encrypted_data = SecurePy.encrypt_data(data, key)
+        encrypted_data = SecurePy.encrypt_data_gcm(data, key)
         logger.info(f"Encrypted Data: {base64.b64encode(encrypted_data).decode('utf-8')}")
 
-        # Decrypt data
-        decrypted_data = SecurePy.decrypt_data(encrypted_data, key)
+        # Decrypt and verify data
+        decrypted_data = SecurePy.decrypt_data_gcm(encrypted_data, key)
         logger.info(f"Decrypted Data: {decrypted_data.decode('utf-8')}")
 
-        # Hash data
-        data_hash = SecurePy.hash_data(data)
-        logger.info(f"Data Hash: {data_hash}")
-
         # Generate a salt
         salt = SecurePy.generate_salt()
 
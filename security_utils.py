@@ -1,10 +1,15 @@
 import os
+import secrets
+from functools import lru_cache
 from Crypto.Cipher import AES, PKCS1_OAEP
 from Crypto.PublicKey import RSA
 from Crypto.Util.Padding import pad, unpad
-from Crypto.Random import get_random_bytes
 import hashlib
 
+# Layout of aes_encrypt_gcm output: PyCryptodome's default 16-byte nonce and 16-byte tag around the ciphertext
+_GCM_NONCE_SIZE = 16
+_GCM_TAG_SIZE = 16
+
 class EncryptionError(Exception):
     """Custom exception for encryption-related errors."""
     pass
@@ -82,6 +87,77 @@ def aes_decrypt(ciphertext, key):
     except Exception as e:
         raise DecryptionError(f"AES decryption failed: {e}")
 
+def aes_encrypt_gcm(plaintext, key):
+    """
+    Encrypts and authenticates a plaintext string using AES in GCM mode.
+
+    GCM's counter-mode keystream has no dependency between blocks, so AES-NI
+    can pipeline them (CBC encryption is serial), and no padding is needed.
+    A fresh random nonce is generated for every call.
+
+    Parameters:
+        plaintext (str): The plaintext string to encrypt.
+        key (bytes): The AES key to use for encryption (must be 16, 24, or 32 bytes long).
+
+    Returns:
+        bytes: The encrypted data (nonce + ciphertext + tag).
+
+    Raises:
+        EncryptionError: If encryption fails.
+    """
+    try:
+        cipher = AES.new(key, AES.MODE_GCM)
+        ct_bytes, tag = cipher.encrypt_and_digest(plaintext.encode('utf-8'))
+        return cipher.nonce + ct_bytes + tag
+    except Exception as e:
+        raise EncryptionError(f"AES encryption failed: {e}")
+
+def aes_decrypt_gcm(ciphertext, key):
+    """
+    Decrypts and verifies data produced by aes_encrypt_gcm.
+
+    Parameters:
+        ciphertext (bytes): The encrypted data to decrypt (nonce + ciphertext + tag).
+        key (bytes): The AES key to use for decryption (must be 16, 24, or 32 bytes long).
+
+    Returns:
+        str: The decrypted plaintext string.
+
+    Raises:
+        DecryptionError: If decryption fails or the data has been tampered with.
+    """
+    try:
+        if len(ciphertext) < _GCM_NONCE_SIZE + _GCM_TAG_SIZE:
+            raise ValueError("ciphertext is too short")
+        nonce = ciphertext[:_GCM_NONCE_SIZE]
+        tag = ciphertext[-_GCM_TAG_SIZE:]
+        cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+        pt = cipher.decrypt_and_verify(ciphertext[_GCM_NONCE_SIZE:-_GCM_TAG_SIZE], tag)
+        return pt.decode('utf-8')
+    except Exception as e:
+        raise DecryptionError(f"AES decryption failed: {e}")
+
+@lru_cache(maxsize=32)
+def _import_rsa_key(key_data):
+    """
+    Parses an RSA key once per distinct key, so repeated calls with the same key skip PEM/DER decoding.
+
+    Parameters:
+        key_data (bytes): The exported RSA key.
+
+    Returns:
+        RsaKey: The imported key.
+    """
+    return RSA.import_key(key_data)
+
+def _rsa_key(key):
+    """
+    Returns the imported RSA key for exported key bytes or a PEM string, from the cache when possible.
+    """
+    if isinstance(key, str):
+        key = key.encode('utf-8')
+    return _import_rsa_key(bytes(key))
+
 def rsa_encrypt(plaintext, public_key):
     """
     Encrypts a plaintext string using RSA encryption.
@@ -97,8 +173,7 @@ def rsa_encrypt(plaintext, public_key):
         EncryptionError: If encryption fails.
     """
     try:
-        public_key = RSA.import_key(public_key)
-        cipher = PKCS1_OAEP.new(public_key)
+        cipher = PKCS1_OAEP.new(_rsa_key(public_key))
         return cipher.encrypt(plaintext.encode('utf-8'))
     except Exception as e:
         raise EncryptionError(f"RSA encryption failed: {e}")
@@ -118,8 +193,7 @@ def rsa_decrypt(ciphertext, private_key):
         DecryptionError: If decryption fails.
     """
     try:
-        private_key = RSA.import_key(private_key)
-        cipher = PKCS1_OAEP.new(private_key)
+        cipher = PKCS1_OAEP.new(_rsa_key(private_key))
         return cipher.decrypt(ciphertext).decode('utf-8')
     except Exception as e:
         raise DecryptionError(f"RSA decryption failed: {e}")
@@ -142,6 +216,25 @@ def sha256_hash(plaintext):
     except Exception as e:
         raise HashingError(f"SHA-256 hashing failed: {e}")
 
+def sha256_hash_file(path):
+    """
+    Hashes a file's contents using SHA-256, reading it in chunks instead of all at once.
+
+    Parameters:
+        path (str): The path of the file to hash.
+
+    Returns:
+        str: The resulting SHA-256 hash in hexadecimal format.
+
+    Raises:
+        HashingError: If the file cannot be read or hashing fails.
+    """
+    try:
+        with open(path, 'rb', buffering=0) as file:
+            return hashlib.file_digest(file, 'sha256').hexdigest()
+    except Exception as e:
+        raise HashingError(f"SHA-256 hashing failed: {e}")
+
 def verify_sha256_hash(plaintext, hash_value):
     """
     Verifies a plaintext string against a given SHA-256 hash.
@@ -165,7 +258,7 @@ if __name__ == "__main__":
     # Example usage
     try:
         # AES Encryption/Decryption
-        aes_key = get_random_bytes(16)
+        aes_key = secrets.token_bytes(16)
         plaintext = "This is a secret message."
         ciphertext = aes_encrypt(plaintext, aes_key)
         decrypted_text = aes_decrypt(ciphertext, aes_key)
@@ -1,7 +1,113 @@
 import psutil
+import re
 import time
 import threading
-from datetime import datetime
+from contextlib import nullcontext
+
+# Size of the log file buffer that holds entries between flushes
+_WRITE_BUFFER = 64 * 1024
+
+# Log line layout, formatted straight to bytes for the binary log file
+_LOG_TEMPLATE = b"%s | CPU: %.2f%% | Memory: %.2f%% | Available Memory: %.2f MB\n"
+
+# The two /proc/meminfo fields psutil.virtual_memory derives percent and available from
+_MEMINFO_FIELDS = re.compile(rb'^(MemTotal|MemAvailable):\s+(\d+) kB', re.MULTILINE)
+
+# Last reading of each shared metric: key -> (time.monotonic() when read, value)
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(key, ttl, read):
+    """Returns read()'s result, reusing a reading younger than ttl seconds so concurrent callers share one read."""
+    with _cache_lock:
+        now = time.monotonic()
+        entry = _cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = read()
+        _cache[key] = (now, value)
+        return value
+
+
+def virtual_memory(ttl=1.0):
+    """
+    Returns psutil.virtual_memory(), shared by every caller for up to ttl seconds.
+
+    Meant for code that polls memory from several places (dashboards,
+    alerters) alongside a SystemMonitor: within the TTL they all get one
+    reading instead of each parsing /proc/meminfo again.
+
+    Args:
+        ttl (float): The longest age in seconds of a reading that is reused.
+
+    Returns:
+        namedtuple: The memory statistics, as psutil.virtual_memory returns them.
+    """
+    return _cached('virtual_memory', ttl, psutil.virtual_memory)
+
+
+def _open_proc(path):
+    """Opens a /proc file such as /proc/meminfo for repeated reads, or returns an empty context where it is unavailable."""
+    try:
+        return open(path, 'rb', buffering=0)
+    except OSError:
+        return nullcontext()
+
+
+def _cpu_times(stat):
+    """
+    Returns the busy and total CPU time counted so far, from the first line of /proc/stat.
+
+    The figures are the ones psutil.cpu_percent compares: guest time is
+    already part of user time and is not counted twice, and iowait counts as idle.
+
+    Args:
+        stat (io.FileIO): /proc/stat opened by _open_proc.
+
+    Returns:
+        tuple: (busy, total) in clock ticks.
+    """
+    stat.seek(0)
+    # One read; the aggregate "cpu" line always comes first and is far shorter than this
+    fields = stat.read(4096).split(b'\n', 1)[0].split()
+    times = list(map(int, fields[1:]))
+    idle = sum(times[3:5])
+    total = sum(times[:8])
+    return total - idle, total
+
+
+def _cpu_percent(previous, current):
+    """Returns the CPU usage percentage between two _cpu_times readings, rounded like psutil.cpu_percent."""
+    total = current[1] - previous[1]
+    if total <= 0:
+        return 0.0
+    return round(min(max((current[0] - previous[0]) / total * 100, 0.0), 100.0), 1)
+
+
+def _memory_usage(meminfo):
+    """
+    Returns the used memory percentage and the available memory in bytes.
+
+    With an open /proc/meminfo the two figures are read from it directly,
+    rewinding the handle each time; otherwise psutil.virtual_memory is used.
+    Both give the same values.
+
+    Args:
+        meminfo (Optional[io.FileIO]): /proc/meminfo opened by _open_proc, or None.
+
+    Returns:
+        tuple: (percent used, available bytes).
+    """
+    if meminfo is not None:
+        meminfo.seek(0)
+        fields = dict(_MEMINFO_FIELDS.findall(meminfo.readall()))
+        if len(fields) == 2:
+            total = int(fields[b'MemTotal']) * 1024
+            available = int(fields[b'MemAvailable']) * 1024
+            return round((total - available) / total * 100, 1), available
+    memory_info = psutil.virtual_memory()
+    return memory_info.percent, memory_info.available
 
 class SystemMonitor:
     """
@@ -10,45 +116,73 @@ class SystemMonitor:
     Attributes:
         interval (int): The interval in seconds between each log entry.
         log_file (str): The path to the file where logs will be saved.
+        flush_every (int): The number of log entries buffered before they are written to the file.
+        verbose (bool): Whether each log entry is also printed.
         _monitoring (bool): A flag indicating whether the monitoring process is active.
+        _stop_event (threading.Event): Set by stop() to wake the monitoring thread immediately.
         _thread (threading.Thread): The thread running the monitoring process.
     """
 
-    def __init__(self, log_file='system_monitor.log', interval=5):
+    def __init__(self, log_file='system_monitor.log', interval=5, flush_every=10, verbose=True):
         """
         Initialize the SystemMonitor with the specified log file and interval.
 
         Args:
             log_file (str): The path to the file where logs will be saved.
             interval (int): The interval in seconds between each log entry.
+            flush_every (int): The number of log entries buffered before they are written to the file;
+                the rest are written when monitoring stops.
+            verbose (bool): Whether each log entry is also printed.
         """
         self.interval = interval
         self.log_file = log_file
+        self.flush_every = flush_every
+        self.verbose = verbose
         self._monitoring = False
+        self._stop_event = threading.Event()
         self._thread = None
 
     def _log_usage(self):
-        """Logs the CPU and memory usage to the specified log file."""
-        while self._monitoring:
-            try:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                cpu_usage = psutil.cpu_percent(interval=None)
-                memory_info = psutil.virtual_memory()
-                memory_usage = memory_info.percent
-                log_entry = (f"{timestamp} | CPU: {cpu_usage:.2f}% | Memory: {memory_usage:.2f}% | "
-                             f"Available Memory: {memory_info.available / 1024**2:.2f} MB\n")
-                with open(self.log_file, 'a') as file:
+        """
+        Logs the CPU and memory usage to the specified log file.
+
+        The first CPU reading only sets the baseline, so each entry reports the
+        CPU usage over the interval before it. On Linux CPU and memory figures
+        are read straight from /proc/stat and /proc/meminfo through handles
+        kept open for the run; elsewhere psutil provides them. Between entries
+        the thread blocks on the stop event instead of sleeping.
+        """
+        try:
+            # Opened once; entries collect in the buffer and reach the file every flush_every samples
+            with _open_proc('/proc/stat') as stat, _open_proc('/proc/meminfo') as meminfo, \
+                    open(self.log_file, 'ab', buffering=_WRITE_BUFFER) as file:
+                if stat is not None:
+                    cpu_times = _cpu_times(stat)
+                else:
+                    psutil.cpu_percent(interval=None)
+                pending = 0
+                while not self._stop_event.wait(self.interval):
+                    timestamp = time.strftime('%Y-%m-%d %H:%M:%S').encode()
+                    if stat is not None:
+                        previous, cpu_times = cpu_times, _cpu_times(stat)
+                        cpu_usage = _cpu_percent(previous, cpu_times)
+                    else:
+                        cpu_usage = psutil.cpu_percent(interval=None)
+                    memory_usage, available_memory = _memory_usage(meminfo)
+                    log_entry = _LOG_TEMPLATE % (timestamp, cpu_usage, memory_usage, available_memory / 1024**2)
                     file.write(log_entry)
-                print(log_entry.strip())
-                time.sleep(self.interval)
-            except IOError as e:
-                print(f"Error writing to log file: {e}")
-                self._monitoring = False
-                break
-            except Exception as e:
-                print(f"Unexpected error: {e}")
-                self._monitoring = False
-                break
+                    pending += 1
+                    if pending >= self.flush_every:
+                        file.flush()
+                        pending = 0
+                    if self.verbose:
+                        print(log_entry.decode().strip())
+        except IOError as e:
+            print(f"Error writing to log file: {e}")
+            self._monitoring = False
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            self._monitoring = False
 
     def start(self):
         """
@@ -56,6 +190,7 @@ class SystemMonitor:
         """
         if not self._monitoring:
             self._monitoring = True
+            self._stop_event.clear()
             self._thread = threading.Thread(target=self._log_usage, daemon=True)
             self._thread.start()
 
@@ -65,6 +200,7 @@ class SystemMonitor:
         """
         if self._monitoring:
             self._monitoring = False
+            self._stop_event.set()
             if self._thread is not None:
                 self._thread.join()
 
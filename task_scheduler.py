@@ -1,8 +1,12 @@
+import heapq
+import itertools
+from collections import deque
 import time
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -25,7 +29,7 @@ class Task:
         self.run_at = run_at
         self.interval = interval
         self.is_repeating = interval is not None
-        self.thread = None
+        self.cancelled = False
 
     def run(self):
         """Run the task and handle any exceptions."""
@@ -41,11 +45,23 @@ class Task:
 
 
 class TaskScheduler:
-    def __init__(self):
-        """Initialize the TaskScheduler."""
-        self.tasks: List[Task] = []
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the TaskScheduler.
+
+        :param max_workers: The number of worker threads that run due tasks (defaults to ThreadPoolExecutor's default).
+        """
+        # Min-heap of (run_at, sequence, task); the sequence keeps equal run_at entries in scheduling order.
+        # Only the scheduler loop changes it, under the lock; new tasks wait in _incoming until it drains them.
+        self.tasks: List[Tuple[float, int, Task]] = []
+        self._incoming: deque = deque()
+        self._sequence = itertools.count()
         self.running = False
         self.lock = threading.Lock()
+        # Set to wake the scheduler loop early: a new task or a stop
+        self._wakeup = threading.Event()
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     def schedule_task(self, func: Callable, run_at: float):
         """
@@ -57,8 +73,9 @@ class TaskScheduler:
         if run_at <= time.time():
             raise TaskError("run_at time must be in the future.")
         with self.lock:
-            self.tasks.append(Task(func, run_at=run_at))
+            self._incoming.append(Task(func, run_at=run_at))
             logging.info(f"Scheduled one-time task at {datetime.fromtimestamp(run_at)}")
+        self._wakeup.set()
 
     def schedule_repeating_task(self, func: Callable, interval: float):
         """
@@ -70,41 +87,81 @@ class TaskScheduler:
         if interval <= 0:
             raise TaskError("Interval must be greater than zero.")
         with self.lock:
-            self.tasks.append(Task(func, interval=interval, run_at=time.time() + interval))
+            self._incoming.append(Task(func, interval=interval, run_at=time.time() + interval))
             logging.info(f"Scheduled repeating task every {interval} seconds")
+        self._wakeup.set()
+
+    def _push(self, task: Task):
+        """Add a task to the heap at its run_at; only called from the scheduler loop, with the lock held."""
+        heapq.heappush(self.tasks, (task.run_at, next(self._sequence), task))
 
     def start(self):
         """Start the task scheduler."""
+        # Due tasks run on reused worker threads instead of a new thread each
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="TaskScheduler")
         self.running = True
         threading.Thread(target=self._run).start()
         logging.info("Task scheduler started")
 
     def stop(self):
-        """Stop the task scheduler."""
+        """Stop the task scheduler, waiting for tasks that are already running to finish."""
         with self.lock:
             self.running = False
+        self._wakeup.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
         logging.info("Task scheduler stopped")
 
     def _run(self):
-        """Run the scheduler loop to execute tasks."""
+        """
+        Run the scheduler loop to execute tasks.
+
+        Only due tasks are taken off the heap, so a pass costs O(k log n) for
+        k due tasks rather than a scan of all n. The heap is changed under
+        the lock, so a task is always either in the heap or in _incoming when
+        cancel_task or list_tasks look; due tasks are handed to the pool
+        after the lock is released. Between runs the loop blocks
+        until the earliest task is due, or until a task is scheduled or the
+        scheduler is stopped, instead of polling.
+        """
         while self.running:
-            now = time.time()
             with self.lock:
-                for task in self.tasks[:]:
-                    if task.run_at <= now:
-                        task.thread = threading.Thread(target=task.run)
-                        task.thread.start()
-                        if task.is_repeating:
-                            task.schedule_next_run()
-                        else:
-                            self.tasks.remove(task)
-            time.sleep(1)
+                while self._incoming:
+                    self._push(self._incoming.popleft())
+                now = time.time()
+                due = []
+                while self.tasks and self.tasks[0][0] <= now:
+                    task = heapq.heappop(self.tasks)[2]
+                    if task.cancelled:
+                        continue
+                    due.append(task)
+                    if task.is_repeating:
+                        task.schedule_next_run()
+                        self._push(task)
+                # Cancelled tasks are dropped here rather than searched for in cancel_task
+                while self.tasks and self.tasks[0][2].cancelled:
+                    heapq.heappop(self.tasks)
+                next_at = self.tasks[0][0] if self.tasks else None
+            for task in due:
+                # Skips a task cancelled since it was taken off the heap
+                if task.cancelled:
+                    continue
+                try:
+                    self._pool.submit(task.run)
+                except RuntimeError:
+                    # stop() has shut the pool down
+                    return
+            # Cleared before the next scan, so a task added meanwhile is still picked up by it
+            self._wakeup.wait(None if next_at is None else max(0.0, next_at - time.time()))
+            self._wakeup.clear()
 
     def list_tasks(self):
         """List all currently scheduled tasks."""
         with self.lock:
-            for task in self.tasks:
-                logging.info(f"Task scheduled at {datetime.fromtimestamp(task.run_at)}, repeating: {task.is_repeating}")
+            tasks = sorted([task for _, _, task in self.tasks] + list(self._incoming), key=lambda task: task.run_at)
+            for task in tasks:
+                if not task.cancelled:
+                    logging.info(f"Task scheduled at {datetime.fromtimestamp(task.run_at)}, repeating: {task.is_repeating}")
 
     def cancel_task(self, func: Callable):
         """
@@ -113,7 +170,10 @@ class TaskScheduler:
         :param func: The function of the task to be cancelled.
         """
         with self.lock:
-            self.tasks = [task for task in self.tasks if task.func != func]
+            # The scheduler loop only changes the heap under the lock, so between them these cover every task
+            for task in [task for _, _, task in self.tasks] + list(self._incoming):
+                if task.func == func:
+                    task.cancelled = True
             logging.info("Task cancelled")
 
 
@@ -1,7 +1,10 @@
+import ast
+import re
 import schedule
 import time
 import logging
 from datetime import datetime
+from functools import lru_cache
 from threading import Thread, Event
 
 # Setting up logging configuration
@@ -9,6 +12,77 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s',
                     handlers=[logging.StreamHandler()])
 
+# One step of a schedule_time chain: a name, optionally called with literal arguments
+_SCHEDULE_STEP = re.compile(r"([A-Za-z]\w*)(?:\(([^()]*)\))?")
+
+# The Job properties that may follow every(...), and the Job methods that may be called after them
+_SCHEDULE_UNITS = frozenset({
+    'second', 'seconds', 'minute', 'minutes', 'hour', 'hours', 'day', 'days', 'week', 'weeks',
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+})
+_SCHEDULE_CALLS = frozenset({'at', 'to', 'until'})
+
+@lru_cache(maxsize=128)
+def _parse_schedule(schedule_time):
+    """
+    Parses a schedule_time string such as "every(10).seconds" into its steps.
+
+    Only every(...) followed by Job unit or weekday properties and
+    at()/to()/until() calls with literal arguments is accepted; nothing is
+    evaluated, and no other attribute of schedule or the Job is reached. The
+    result is cached, so scheduling the same string again skips the parse.
+
+    Parameters
+    ----------
+    schedule_time : str
+        The schedule description, e.g. "every().day.at('10:30')".
+
+    Returns
+    -------
+    tuple
+        (name, args) pairs, where args is None for an attribute and a tuple for a call.
+
+    Raises
+    ------
+    ValueError
+        If the string is not such a chain.
+    """
+    text = schedule_time.strip()
+    steps = []
+    position = 0
+    while True:
+        match = _SCHEDULE_STEP.match(text, position)
+        if match is None:
+            raise ValueError(f"unexpected text at {text[position:]!r}")
+        name, arguments = match.groups()
+        if not steps:
+            if name != 'every' or arguments is None:
+                raise ValueError("must start with every(...)")
+        elif name in _SCHEDULE_UNITS:
+            if arguments is not None:
+                raise ValueError(f"{name} is a unit and cannot be called")
+        elif name in _SCHEDULE_CALLS:
+            if arguments is None:
+                raise ValueError(f"{name} must be called, e.g. {name}(...)")
+        else:
+            raise ValueError(f"{name} is not a schedule unit, weekday, at(), to() or until()")
+        if arguments is None:
+            args = None
+        elif arguments.strip():
+            try:
+                args = ast.literal_eval(f"({arguments},)")
+            except (ValueError, SyntaxError):
+                raise ValueError(f"arguments of {name}() must be literals")
+        else:
+            args = ()
+        steps.append((name, args))
+        position = match.end()
+        if position == len(text):
+            return tuple(steps)
+        if text[position] != '.':
+            raise ValueError(f"unexpected text at {text[position:]!r}")
+        position += 1
+
 class TaskScheduler:
     """
     A class used to schedule and automate tasks.
@@ -54,10 +128,15 @@ class TaskScheduler:
             Additional keyword arguments to pass to the task function.
         """
         try:
-            schedule_code = f"schedule.{schedule_time}.do(task, *args, **kwargs)"
-            job = eval(schedule_code, {"schedule": schedule, "task": task, "args": args, "kwargs": kwargs})
+            # Replays the parsed chain with getattr instead of eval'ing the string
+            job = schedule
+            for name, step_args in _parse_schedule(schedule_time):
+                job = getattr(job, name)
+                if step_args is not None:
+                    job = job(*step_args)
+            job = job.do(task, *args, **kwargs)
             logging.info(f"Task {task.__name__} scheduled to run {schedule_time}")
-        except NameError as e:
+        except ValueError as e:
             logging.error(f"Error scheduling task: invalid schedule_time format. {e}")
         except Exception as e:
             logging.error(f"Error scheduling task: {e}")
@@ -92,15 +171,20 @@ class TaskScheduler:
         """
         The loop that runs the scheduler, checking for pending tasks at specified intervals.
 
+        Between checks the loop waits on stop_event, so stop_scheduler takes
+        effect at once, and never longer than until the next job is due.
+
         Parameters
         ----------
         interval : int
-            The interval time in seconds to check for scheduled tasks.
+            The longest time in seconds between checks for scheduled tasks.
         """
         logging.info("Scheduler loop started")
         while not self.stop_event.is_set():
             self.run_pending()
-            time.sleep(interval)
+            next_run = schedule.idle_seconds()
+            timeout = interval if next_run is None else min(interval, next_run)
+            self.stop_event.wait(max(0, timeout))
         logging.info("Scheduler loop stopped")
 
     def stop_scheduler(self):
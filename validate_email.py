@@ -1,22 +1,32 @@
 import re
 from typing import List
 
+# Compiled once at import; fullmatch anchors both ends, so the pattern needs no ^ or $
+_EMAIL_RE = re.compile(r'(?!.*?[.]{2})[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+')
+
+# Shortest address the pattern accepts (a@b.c), and the longest address RFC 5321 allows
+_MIN_EMAIL_LENGTH = 5
+_MAX_EMAIL_LENGTH = 254
+
+# Matches every line of a newline-joined buffer that is not a valid address: a whole line the pattern above rejects
+_INVALID_LINES_RE = re.compile(r'^(?!(?!.*?[.]{2})[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$).*$', re.MULTILINE)
+
 def validate_email(email: str) -> bool:
     """
     Validate the given email address using a regular expression.
 
+    Addresses outside the length bounds or without exactly one '@' are
+    rejected before the regular expression runs.
+
     Args:
         email (str): The email address to validate.
 
     Returns:
         bool: True if the email address is valid, False otherwise.
     """
-    # Regular expression pattern for validating an email address
-    pattern = re.compile(
-        r'^(?!.*?[.]{2})[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    )
-    
-    return bool(pattern.match(email))
+    if not _MIN_EMAIL_LENGTH <= len(email) <= _MAX_EMAIL_LENGTH or email.count('@') != 1:
+        return False
+    return _EMAIL_RE.fullmatch(email) is not None
 
 def validate_email_list(emails: List[str]) -> List[str]:
     """
@@ -28,11 +38,15 @@ def validate_email_list(emails: List[str]) -> List[str]:
     Returns:
         List[str]: A list containing invalid email addresses.
     """
-    invalid_emails = []
-    for email in emails:
-        if not validate_email(email):
-            invalid_emails.append(email)
-    return invalid_emails
+    if not emails:
+        return []
+    buffer = "\n".join(emails)
+    if buffer.count("\n") != len(emails) - 1 or max(map(len, emails)) > _MAX_EMAIL_LENGTH:
+        # An address containing a newline would span lines, and the pattern alone does not bound
+        # the length (its minimum is already _MIN_EMAIL_LENGTH); check each address on its own
+        return [email for email in emails if not validate_email(email)]
+    # One scan of the joined buffer returns the invalid lines, in order, without a Python-level call per address
+    return _INVALID_LINES_RE.findall(buffer)
 
 def main():
     """
@@ -1,24 +1,65 @@
 # web_scraping_utils.py
 
+import asyncio
+import random
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
 from bs4 import BeautifulSoup
 import time
 
+try:
+    import lxml.etree
+    import lxml.html
+
+    _PARSER = 'lxml'
+except ImportError:  # lxml is optional; BeautifulSoup falls back to Python's own HTML parser
+    lxml = None
+    _PARSER = 'html.parser'
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; only needed for fetch_html_async and fetch_many
+    httpx = None
+
+# Shared by every fetch so connections to a host are kept alive and reused instead of
+# paying a TCP and TLS handshake per call; retries stay in fetch_html, which takes them per call
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=32)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+def _is_retryable(status_code):
+    """
+    Whether a failed response is worth retrying: rate limiting (429) and server errors (5xx) are
+    usually transient, while other 4xx responses will fail the same way again.
+    """
+    return status_code == 429 or status_code >= 500
+
+def _backoff(delay, attempt):
+    """
+    Seconds to wait before the retry after a given (zero-based) attempt: exponential, with
+    +/-50% jitter so many clients failing together do not retry in lockstep.
+    """
+    return delay * 2 ** attempt * random.uniform(0.5, 1.5)
+
 def fetch_html(url, retries=3, delay=2):
     """
     Fetch HTML content from the specified URL.
 
+    Network errors, 429 and 5xx responses are retried after about delay,
+    2 * delay, 4 * delay, ... seconds; any other HTTP error is raised at once.
+
     Args:
         url (str): The URL of the web page to fetch.
         retries (int): Number of retries for failed requests. Default is 3.
-        delay (int): Delay between retries in seconds. Default is 2 seconds.
+        delay (int): Base delay between retries in seconds. Default is 2 seconds.
 
     Returns:
         str: HTML content of the web page.
 
     Raises:
-        HTTPError: If an HTTP error occurs.
+        HTTPError: If the server answers with a status that is not worth retrying.
         ConnectionError: If a connection error occurs.
         Timeout: If the request times out.
         RequestException: If any other request-related error occurs.
@@ -26,11 +67,13 @@ def fetch_html(url, retries=3, delay=2):
     attempt = 0
     while attempt < retries:
         try:
-            response = requests.get(url, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             response.raise_for_status()
             return response.text
         except HTTPError as http_err:
             print(f"HTTP error occurred: {http_err}")
+            if http_err.response is not None and not _is_retryable(http_err.response.status_code):
+                raise
         except ConnectionError as conn_err:
             print(f"Connection error occurred: {conn_err}")
         except Timeout as timeout_err:
@@ -39,21 +82,185 @@ def fetch_html(url, retries=3, delay=2):
             print(f"General error occurred: {req_err}")
         
         attempt += 1
-        time.sleep(delay)
+        if attempt < retries:
+            print(f"Retrying {url} (attempt {attempt + 1} of {retries})")
+            time.sleep(_backoff(delay, attempt - 1))
     
     raise Exception(f"Failed to fetch HTML content from {url} after {retries} attempts")
 
+async def fetch_html_async(url, client, semaphore, retries=3, delay=2):
+    """
+    Fetch HTML content from the specified URL without blocking the event loop.
+
+    Network errors, 429 and 5xx responses are retried after about delay,
+    2 * delay, 4 * delay, ... seconds; any other HTTP error is raised at once.
+
+    Args:
+        url (str): The URL of the web page to fetch.
+        client (httpx.AsyncClient): Client whose connection pool the request uses.
+        semaphore (asyncio.Semaphore): Bounds how many fetches are in flight at once.
+        retries (int): Number of attempts for failed requests. Default is 3.
+        delay (int): Base delay before the first retry in seconds. Default is 2 seconds.
+
+    Returns:
+        str: HTML content of the web page.
+
+    Raises:
+        httpx.HTTPStatusError: If the server answers with a status that is not worth retrying.
+        Exception: If every attempt fails.
+    """
+    for attempt in range(retries):
+        try:
+            async with semaphore:
+                response = await client.get(url, timeout=10)
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPStatusError as http_err:
+            print(f"HTTP error occurred: {http_err}")
+            if not _is_retryable(http_err.response.status_code):
+                raise
+        except httpx.ConnectError as conn_err:
+            print(f"Connection error occurred: {conn_err}")
+        except httpx.TimeoutException as timeout_err:
+            print(f"Timeout error occurred: {timeout_err}")
+        except httpx.RequestError as req_err:
+            print(f"General error occurred: {req_err}")
+
+        if attempt + 1 < retries:
+            print(f"Retrying {url} (attempt {attempt + 2} of {retries})")
+            await asyncio.sleep(_backoff(delay, attempt))
+
+    raise Exception(f"Failed to fetch HTML content from {url} after {retries} attempts")
+
+def fetch_many(urls, concurrency=100, retries=3, delay=2):
+    """
+    Fetch HTML content from many URLs concurrently on one event loop.
+
+    All requests share one httpx.AsyncClient, so connections are pooled and
+    at most concurrency requests are in flight at a time.
+
+    Args:
+        urls (Iterable[str]): The URLs of the web pages to fetch.
+        concurrency (int): Maximum number of simultaneous requests. Default is 100.
+        retries (int): Number of attempts for each failed request. Default is 3.
+        delay (int): Delay before the first retry in seconds. Default is 2 seconds.
+
+    Returns:
+        list: HTML content of each web page, in the order given.
+
+    Raises:
+        ImportError: If httpx is not installed.
+        Exception: If every attempt for some URL fails.
+    """
+    if httpx is None:
+        raise ImportError("fetch_many requires httpx (pip install httpx).")
+
+    async def fetch_all():
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits) as client:
+            return await asyncio.gather(*(fetch_html_async(url, client, semaphore, retries, delay) for url in urls))
+
+    return asyncio.run(fetch_all())
+
 def parse_html(html_content):
     """
     Parse the HTML content using BeautifulSoup.
 
+    The tree is built by lxml's C parser when lxml is installed, and by
+    Python's html.parser otherwise.
+
     Args:
         html_content (str): The HTML content to parse.
 
     Returns:
         BeautifulSoup: Parsed HTML content as a BeautifulSoup object.
     """
-    return BeautifulSoup(html_content, 'html.parser')
+    return BeautifulSoup(html_content, _PARSER)
+
+def parse_html_tree(html_content):
+    """
+    Parse the HTML content straight into an lxml element tree, skipping BeautifulSoup.
+
+    Faster than parse_html when only XPath or CSS queries are needed
+    (``tree.xpath(...)``, or ``tree.cssselect(...)`` with cssselect installed).
+
+    Args:
+        html_content (str): The HTML content to parse.
+
+    Returns:
+        lxml.html.HtmlElement: Root element of the parsed document.
+
+    Raises:
+        ImportError: If lxml is not installed.
+    """
+    if lxml is None:
+        raise ImportError("parse_html_tree requires lxml (pip install lxml).")
+    return lxml.html.fromstring(html_content)
+
+# Bytes read from the response per parser feed in the streaming functions
+_STREAM_CHUNK = 16384
+
+def iter_html_elements(url, tag=None):
+    """
+    Stream a web page into lxml's incremental parser, yielding elements as they are completed.
+
+    Parsing overlaps the download, and the document is never held as one
+    string, so peak memory stays at the tree being built. Callers that only
+    need each element once can call ``element.clear()`` after using it to
+    keep even the tree small.
+
+    Args:
+        url (str): The URL of the web page to fetch.
+        tag (str, optional): Only yield elements with this tag. Defaults to all elements.
+
+    Yields:
+        lxml.etree._Element: Each element once its closing tag has been parsed.
+
+    Raises:
+        ImportError: If lxml is not installed.
+        HTTPError: If the server answers with an error status.
+        RequestException: If the request fails; streamed requests are not retried.
+    """
+    if lxml is None:
+        raise ImportError("iter_html_elements requires lxml (pip install lxml).")
+    parser = lxml.etree.HTMLPullParser(events=('end',), tag=tag)
+    with _SESSION.get(url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=_STREAM_CHUNK):
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                yield element
+    parser.close()
+    for _, element in parser.read_events():
+        yield element
+
+def fetch_html_tree(url):
+    """
+    Fetch and parse a web page in one streaming pass, returning its lxml element tree.
+
+    The blocking counterpart of iter_html_elements: unlike
+    parse_html_tree(fetch_html(url)) no full copy of the page text is made.
+
+    Args:
+        url (str): The URL of the web page to fetch.
+
+    Returns:
+        lxml.etree._Element: Root element of the parsed document.
+
+    Raises:
+        ImportError: If lxml is not installed.
+        HTTPError: If the server answers with an error status.
+        RequestException: If the request fails; streamed requests are not retried.
+    """
+    if lxml is None:
+        raise ImportError("fetch_html_tree requires lxml (pip install lxml).")
+    parser = lxml.etree.HTMLParser()
+    with _SESSION.get(url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=_STREAM_CHUNK):
+            parser.feed(chunk)
+    return parser.close()
 
 # Example usage
 if __name__ == "__main__":